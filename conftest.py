@@ -1,9 +1,41 @@
 """Pytest configuration and fixtures for the project."""
 
 import asyncio
+import os
+from pathlib import Path
 
 import pytest
 
+# Any one of these lets the sample agents reach a model; the Google ADK
+# agents use GOOGLE_API_KEY (or Vertex AI), the LiteLLM one Anthropic
+AGENT_CREDENTIAL_VARS = (
+    "GOOGLE_API_KEY",
+    "ANTHROPIC_API_KEY",
+)
+
+
+def _has_agent_credentials() -> bool:
+    """Check for model credentials, reading the project .env like the agents."""
+    # Imported here so the regular suite runs without python-dotenv
+    from dotenv import load_dotenv
+
+    load_dotenv(Path(__file__).parent / ".env")
+    if any(os.getenv(name) for name in AGENT_CREDENTIAL_VARS):
+        return True
+    # A flag rather than a credential; google-genai reads it the same way
+    vertex_flag = os.getenv("GOOGLE_GENAI_USE_VERTEXAI", "")
+    return vertex_flag.lower() in ("true", "1")
+
+
+def pytest_addoption(parser):
+    """Add the option that opts in to agent evaluation tests."""
+    parser.addoption(
+        "--run-agent",
+        action="store_true",
+        default=False,
+        help="run agent_evaluation tests (slow, call a remote model)",
+    )
+
 
 def pytest_configure(config):
     """Configure pytest with custom settings."""
@@ -18,9 +50,20 @@ def pytest_collection_modifyitems(config, items):
     """Modify test collection to handle agent evaluation tests specially."""
     agent_tests = []
     other_tests = []
+    skip_agent = None
+    if not config.getoption("--run-agent"):
+        skip_agent = pytest.mark.skip(reason="need --run-agent option to run")
+    elif not _has_agent_credentials():
+        # Without credentials every model call would only time out
+        skip_agent = pytest.mark.skip(
+            reason=f"need one of {', '.join(AGENT_CREDENTIAL_VARS)} "
+            "or GOOGLE_GENAI_USE_VERTEXAI=true to run"
+        )
 
     for item in items:
         if item.get_closest_marker("agent_evaluation"):
+            if skip_agent is not None:
+                item.add_marker(skip_agent)
             agent_tests.append(item)
         else:
             other_tests.append(item)
@@ -74,6 +74,7 @@ from .json_tools import (
 from .validation import (
     check_required_fields,
     create_validation_report,
+    validate_batch,
     validate_data_types_simple,
     validate_range_simple,
     validate_schema_simple,
@@ -130,6 +131,7 @@ __all__: list[str] = [
     "validate_data_types_simple",
     "validate_range_simple",
     "create_validation_report",
+    "validate_batch",
     # Configuration processing (16 functions - 8 read/write + 8 token-saving)
     "read_yaml_file",
     "write_yaml_file",
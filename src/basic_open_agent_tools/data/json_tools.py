@@ -1,14 +1,43 @@
 """JSON processing utilities for AI agents."""
 
 import json
+import re
 from typing import Any, Union
 
 from .._logging import get_logger
 from ..decorators import strands_tool
 from ..exceptions import SerializationError
 
+# Optional fast JSON backend; stdlib json remains the reference behavior
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = get_logger("data.json_tools")
 
+# 19+ digits may overflow 64-bit integers; may also match inside strings,
+# which only costs a stdlib fallback
+_LONG_DIGIT_RUN = re.compile(r"\d{19}")
+
+
+def _json_loads(json_str: str) -> Any:
+    """Parse a JSON string, preferring orjson when it is installed.
+
+    Falls back to stdlib json when orjson rejects the input, so stdlib-only
+    extensions (NaN, Infinity) still parse and error messages stay the same.
+    Input with integers that may not fit in 64 bits also goes to stdlib json,
+    since orjson would parse them as lossy floats.
+    """
+    if HAS_ORJSON and _LONG_DIGIT_RUN.search(json_str) is None:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_str)
+
 
 @strands_tool
 def safe_json_serialize(data: dict, indent: int) -> str:
@@ -74,7 +103,7 @@ def safe_json_deserialize(json_str: str) -> dict:
     logger.debug(f"Deserializing JSON string ({len(json_str)} characters)")
 
     try:
-        result = json.loads(json_str)
+        result = _json_loads(json_str)
         # Always return dict for agent compatibility
         if isinstance(result, dict):
             final_result = result
@@ -114,7 +143,7 @@ def validate_json_string(json_str: str) -> bool:
     logger.debug(f"Validating JSON string ({len(json_str)} characters)")
 
     try:
-        json.loads(json_str)
+        _json_loads(json_str)
         logger.debug("[DATA] JSON validation: valid")
         return True
     except (json.JSONDecodeError, ValueError) as e:
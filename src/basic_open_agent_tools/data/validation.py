@@ -1,5 +1,13 @@
 """Data validation utilities for AI agents."""
 
+import copy
+import re
+import sys
+from collections.abc import Sequence
+from collections.abc import Set as AbstractSet
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
 from ..decorators import strands_tool
 from ..exceptions import ValidationError
 
@@ -27,40 +35,86 @@ def validate_schema_simple(data: dict, schema_definition: dict) -> bool:
     if not isinstance(schema_definition, dict):
         raise TypeError("schema_definition must be a dictionary")
 
-    try:
-        _validate_against_schema(data, schema_definition)
-        return True
-    except ValidationError:
-        raise
+    _get_schema_validator(schema_definition)(data)
+    return True
+
+
+_SchemaValidator = Callable[[Any], None]
+
 
+_SCHEMA_CACHE: dict[str, _SchemaValidator] = {}
+_SCHEMA_CACHE_SIZE = 256
 
-def _validate_against_schema(data: dict, schema: dict) -> None:
-    """Internal helper to validate data against schema."""
+
+def _get_schema_validator(schema: dict) -> _SchemaValidator:
+    """Return the compiled validator for a schema, reusing cached ones.
+
+    Schemas are keyed by their repr, like rules in _get_rules_validator.
+    Compiling from a deep copy means later mutation of the caller's dict
+    can't leave a stale validator in the cache.
+    """
+    key = repr(schema)
+    validator = _SCHEMA_CACHE.get(key)
+    if validator is None:
+        try:
+            snapshot = copy.deepcopy(schema)
+        except (TypeError, copy.Error):
+            # Holds values that can't be copied, so it can't be cached safely
+            return _compile_schema(schema)
+        validator = _compile_schema(snapshot)
+        if len(_SCHEMA_CACHE) >= _SCHEMA_CACHE_SIZE:
+            _SCHEMA_CACHE.pop(next(iter(_SCHEMA_CACHE)), None)
+        _SCHEMA_CACHE[key] = validator
+    return validator
+
+
+def _compile_schema(schema: dict) -> _SchemaValidator:
+    """Internal helper to turn a schema into a validator closure."""
     schema_type = schema.get("type")
 
     if schema_type == "object":
-        if not isinstance(data, dict):
-            raise ValidationError(f"Expected object, got {type(data).__name__}")
-
         properties = schema.get("properties", {})
-        required = schema.get("required", [])
+        required = tuple(schema.get("required", []))
+        # Only dict values are validated recursively, so only dict
+        # sub-schemas need compiling
+        nested = {
+            prop: _compile_schema(sub_schema)
+            for prop, sub_schema in properties.items()
+            if isinstance(sub_schema, dict)
+        }
+
+        def validate_object(data: Any) -> None:
+            if not isinstance(data, dict):
+                raise ValidationError(f"Expected object, got {_type_name(data)}")
 
-        # Check required properties
-        for prop in required:
-            if prop not in data:
-                raise ValidationError(f"Required property '{prop}' is missing")
+            # Check required properties
+            for prop in required:
+                if prop not in data:
+                    raise ValidationError(f"Required property '{prop}' is missing")
 
-        # Validate properties
-        for prop, value in data.items():
-            if prop in properties:
-                # Only validate dict values recursively
-                if isinstance(value, dict):
-                    _validate_against_schema(value, properties[prop])
+            # Validate properties
+            if nested:
+                for prop, value in data.items():
+                    check = nested.get(prop)
+                    if check is not None and isinstance(value, dict):
+                        check(value)
 
-    elif schema_type == "array":
-        # For dict-only validation, we can't handle arrays directly
-        # This would need to be a dict with array-like structure
-        raise ValidationError("Array validation not supported with dict-only input")
+        return validate_object
+
+    if schema_type == "array":
+
+        def validate_array(data: Any) -> None:
+            # For dict-only validation, we can't handle arrays directly
+            # This would need to be a dict with array-like structure
+            raise ValidationError("Array validation not supported with dict-only input")
+
+        return validate_array
+
+    return _accept_any
+
+
+def _accept_any(data: Any) -> None:
+    """Validator for schemas without a supported type constraint."""
 
 
 @strands_tool
@@ -90,18 +144,113 @@ def check_required_fields(data: dict, required: list[str]) -> bool:
     if not isinstance(required, list):
         raise TypeError("required must be a list")
 
-    missing_fields = [field for field in required if field not in data]
+    required_error = _required_error(data, required, set(required))
+    if required_error is not None:
+        raise ValidationError(required_error)
+
+    return True
+
 
+def _required_error(
+    data: dict, required: Sequence[Any], required_set: AbstractSet[Any]
+) -> Optional[str]:
+    """Build the missing-fields message, or None when all are present.
+
+    The subset test against the key view runs in C and allocates nothing,
+    so the ordered missing list is only built when something is absent.
+    """
+    if data.keys() >= required_set:
+        return None
+    missing_fields = [field for field in required if field not in data]
     if missing_fields:
-        raise ValidationError(f"Required fields are missing: {missing_fields}")
+        return f"Required fields are missing: {missing_fields}"
+    return None
+
+
+# Marks a field absent from data, so a present None value is still checked
+_MISSING = object()
+
+# Accepted Python types per type name; an int is a valid float, as in JSON
+_TYPE_MAPPING: dict[str, tuple[type, ...]] = {
+    "str": (str,),
+    "int": (int,),
+    "float": (float, int),
+    "bool": (bool,),
+    "list": (list,),
+    "dict": (dict,),
+}
+
+
+# Names for the types agent data is built from, looked up by exact type
+_TYPE_NAMES: dict[type, str] = {
+    str: "str",
+    int: "int",
+    float: "float",
+    bool: "bool",
+    list: "list",
+    dict: "dict",
+    type(None): "NoneType",
+}
+
+
+def _type_name(value: Any) -> str:
+    """Return the type name used in validation messages."""
+    value_type = type(value)
+    return _TYPE_NAMES.get(value_type) or value_type.__name__
+
+
+def _is_type(value: Any, accepted: tuple[type, ...]) -> bool:
+    """Check value against accepted types, treating bool as distinct from int."""
+    value_type = type(value)
+    if value_type in accepted:
+        return True
+    if value_type is bool:
+        # bool subclasses int, but True is not an int or float here
+        return False
+    return isinstance(value, accepted)
 
-    return True
+
+_TypeCheck = tuple[Any, str, tuple[type, ...]]
+
+
+def _resolve_type_checks(type_map: dict) -> tuple[_TypeCheck, ...]:
+    """Pair each field with its accepted types, skipping unknown type names."""
+    return tuple(
+        (field, type_name, _TYPE_MAPPING[type_name])
+        for field, type_name in type_map.items()
+        if type_name in _TYPE_MAPPING
+    )
+
+
+def _type_error(data: dict, type_checks: tuple[_TypeCheck, ...]) -> Optional[str]:
+    """Build the combined type error message, or None when all fields match.
+
+    Nothing is allocated until the first mismatch, so the common
+    all-valid case stays cheap.
+    """
+    mismatches: Optional[list[str]] = None
+    for field, type_name, expected_type in type_checks:
+        value = data.get(field, _MISSING)
+        if value is _MISSING or _is_type(value, expected_type):
+            continue
+        if mismatches is None:
+            mismatches = []
+        mismatches.append(
+            f"Field '{field}': expected {type_name}, got {_type_name(value)}"
+        )
+
+    if mismatches is None:
+        return None
+    return f"Type validation errors: {'; '.join(mismatches)}"
 
 
 @strands_tool
 def validate_data_types_simple(data: dict, type_map: dict[str, str]) -> bool:
     """Check that field types match expectations.
 
+    Supported type names are str, int, float, bool, list and dict. Integers
+    are accepted for float, and booleans only match bool.
+
     Args:
         data: Dictionary to validate
         type_map: Mapping of field names to expected type names (as strings)
@@ -125,29 +274,9 @@ def validate_data_types_simple(data: dict, type_map: dict[str, str]) -> bool:
     if not isinstance(type_map, dict):
         raise TypeError("type_map must be a dictionary")
 
-    type_errors = []
-
-    type_mapping = {
-        "str": str,
-        "int": int,
-        "float": float,
-        "bool": bool,
-        "list": list,
-        "dict": dict,
-    }
-
-    for field, expected_type_name in type_map.items():
-        if field in data:
-            value = data[field]
-            expected_type = type_mapping.get(expected_type_name)
-            if expected_type and not isinstance(value, expected_type):
-                actual_type = type(value).__name__
-                type_errors.append(
-                    f"Field '{field}': expected {expected_type_name}, got {actual_type}"
-                )
-
-    if type_errors:
-        raise ValidationError(f"Type validation errors: {'; '.join(type_errors)}")
+    type_error = _type_error(data, _resolve_type_checks(type_map))
+    if type_error is not None:
+        raise ValidationError(type_error)
 
     return True
 
@@ -178,28 +307,44 @@ def validate_range_simple(
         >>> validate_range_simple(15.0, 1.0, 10.0)
         False
     """
+    range_error = _range_error(value, min_val, max_val)
+    if range_error is not None:
+        raise range_error
+
+    return True
+
+
+def _range_error(value: Any, min_val: Any, max_val: Any) -> Optional[Exception]:
+    """Return the error for an out-of-range or non-numeric value, unraised.
+
+    Returning the exception lets the report collect its message without
+    paying for a raise and catch per field.
+    """
     if not isinstance(value, (int, float)):
-        raise TypeError("value must be numeric")
+        return TypeError("value must be numeric")
 
     if not isinstance(min_val, (int, float)):
-        raise TypeError("min_val must be numeric")
+        return TypeError("min_val must be numeric")
 
     if not isinstance(max_val, (int, float)):
-        raise TypeError("max_val must be numeric")
+        return TypeError("max_val must be numeric")
 
     if value < min_val:
-        raise ValidationError(f"Value {value} is below minimum {min_val}")
+        return ValidationError(f"Value {value} is below minimum {min_val}")
 
     if value > max_val:
-        raise ValidationError(f"Value {value} is above maximum {max_val}")
+        return ValidationError(f"Value {value} is above maximum {max_val}")
 
-    return True
+    return None
 
 
 @strands_tool
 def create_validation_report(data: dict, rules: dict) -> dict:
     """Create comprehensive validation report for data.
 
+    Range checks are skipped for fields that are missing or failed their
+    type check, so each problem is reported once.
+
     Args:
         data: Dictionary to validate
         rules: Dictionary of validation rules
@@ -222,62 +367,147 @@ def create_validation_report(data: dict, rules: dict) -> dict:
     if not isinstance(rules, dict):
         raise TypeError("rules must be a dictionary")
 
-    errors = []
-    warnings = []
+    return _get_rules_validator(rules)(data)
 
-    # Check required fields
+
+_RulesValidator = Callable[[dict], dict]
+
+_RULES_CACHE: dict[str, _RulesValidator] = {}
+_RULES_CACHE_SIZE = 256
+
+
+def _get_rules_validator(rules: dict) -> _RulesValidator:
+    """Return the compiled validator for a rules dict, reusing cached ones.
+
+    Rules are keyed by their repr, which tells apart values JSON would
+    conflate (int vs str keys, tuples vs lists). Equal rules built in a
+    different order just miss the cache.
+    """
+    key = repr(rules)
+    validator = _RULES_CACHE.get(key)
+    if validator is None:
+        validator = _compile_rules(rules)
+        if len(_RULES_CACHE) >= _RULES_CACHE_SIZE:
+            _RULES_CACHE.pop(next(iter(_RULES_CACHE)), None)
+        _RULES_CACHE[key] = validator
+    return validator
+
+
+def _intern_field(field: Any) -> Any:
+    """Intern string field names so lookups of interned keys hit by identity.
+
+    Rules loaded from JSON or built at runtime hold fresh strings, while
+    keys written as literals in code are already interned.
+    """
+    return sys.intern(field) if type(field) is str else field
+
+
+def _compile_rules(rules: dict) -> _RulesValidator:
+    """Internal helper to turn a rules dict into a validator closure.
+
+    Everything the closure needs is copied out of rules here, so the
+    caller may mutate or reuse the dict afterwards.
+    """
     required_fields = rules.get("required", [])
-    try:
-        check_required_fields(data, required_fields)
-    except ValidationError as e:
-        errors.append(str(e))
+    if not isinstance(required_fields, list):
+        raise TypeError("required must be a list")
+    required = tuple(_intern_field(field) for field in required_fields)
+    required_set = frozenset(required)
 
-    # Check data types
     type_map = rules.get("types", {})
-    try:
-        validate_data_types_simple(data, type_map)
-    except ValidationError as e:
-        errors.append(str(e))
-
-    # Check ranges for numeric fields
-    ranges = rules.get("ranges", {})
-    for field, range_spec in ranges.items():
-        if field in data:
-            value = data[field]
-            min_val = range_spec.get("min")
-            max_val = range_spec.get("max")
-            try:
-                validate_range_simple(value, min_val, max_val)
-            except (ValidationError, TypeError) as e:
-                errors.append(f"Range validation failed for '{field}': {str(e)}")
-
-    # Check custom patterns
-    patterns = rules.get("patterns", {})
-    for field, pattern in patterns.items():
-        if field in data:
-            import re
-
-            value = str(data[field])
-            try:
-                if not re.match(pattern, value):
-                    errors.append(f"Field '{field}' does not match pattern '{pattern}'")
-            except re.error:
-                warnings.append(f"Invalid regex pattern for field '{field}': {pattern}")
+    if not isinstance(type_map, dict):
+        raise TypeError("type_map must be a dictionary")
+    type_checks = tuple(
+        (_intern_field(field), type_name, expected_type)
+        for field, type_name, expected_type in _resolve_type_checks(type_map)
+    )
+
+    ranges = tuple(
+        (_intern_field(field), range_spec.get("min"), range_spec.get("max"))
+        for field, range_spec in rules.get("ranges", {}).items()
+    )
+
+    # None marks a pattern that failed to compile
+    patterns: list[tuple[Any, Any, Optional[re.Pattern[str]]]] = []
+    for field, pattern in rules.get("patterns", {}).items():
+        try:
+            compiled: Optional[re.Pattern[str]] = _compile_pattern(pattern)
+        except re.error:
+            compiled = None
+        patterns.append((_intern_field(field), pattern, compiled))
 
-    # Check for unexpected fields
     allowed_fields = rules.get("allowed_fields")
-    if allowed_fields:
-        unexpected = set(data.keys()) - set(allowed_fields)
-        if unexpected:
-            warnings.append(f"Unexpected fields found: {list(unexpected)}")
+    allowed = (
+        frozenset(_intern_field(field) for field in allowed_fields)
+        if allowed_fields
+        else None
+    )
+
+    rules_applied = len([k for k in rules.keys() if rules[k]])
+
+    def validate(data: dict) -> dict:
+        errors = []
+        warnings = []
+
+        # Check required fields
+        if required:
+            required_error = _required_error(data, required, required_set)
+            if required_error is not None:
+                errors.append(required_error)
+
+        # Check data types
+        mistyped: AbstractSet[Any] = frozenset()
+        type_error = _type_error(data, type_checks) if type_checks else None
+        if type_error is not None:
+            errors.append(type_error)
+            mistyped = {
+                field
+                for field, _, expected_type in type_checks
+                if field in data and not _is_type(data[field], expected_type)
+            }
+
+        # Check ranges for numeric fields; a field that already failed its
+        # type check is not reported again as non-numeric
+        for field, min_val, max_val in ranges:
+            value = data.get(field, _MISSING)
+            if value is _MISSING or field in mistyped:
+                continue
+            range_error = _range_error(value, min_val, max_val)
+            if range_error is not None:
+                errors.append(f"Range validation failed for '{field}': {range_error}")
+
+        # Check custom patterns
+        for field, pattern, compiled in patterns:
+            value = data.get(field, _MISSING)
+            if value is _MISSING:
+                continue
+            if compiled is None:
+                warnings.append(f"Invalid regex pattern for field '{field}': {pattern}")
+            elif not compiled.match(str(value)):
+                errors.append(f"Field '{field}' does not match pattern '{pattern}'")
+
+        # Check for unexpected fields
+        if allowed is not None:
+            # Listed in data order so the warning text is deterministic
+            unexpected = [field for field in data if field not in allowed]
+            if unexpected:
+                warnings.append(f"Unexpected fields found: {unexpected}")
+
+        return {
+            "valid": len(errors) == 0,
+            "errors": errors,
+            "warnings": warnings,
+            "fields_validated": len(data),
+            "rules_applied": rules_applied,
+        }
 
-    return {
-        "valid": len(errors) == 0,
-        "errors": errors,
-        "warnings": warnings,
-        "fields_validated": len(data),
-        "rules_applied": len([k for k in rules.keys() if rules[k]]),
-    }
+    return validate
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a field pattern once per process; raises re.error if invalid."""
+    return re.compile(pattern)
 
 
 @strands_tool
@@ -326,3 +556,41 @@ def create_validation_report_simple(data: dict, rules: dict) -> dict:
     """
     result: dict = create_validation_report(data, rules)
     return result
+
+
+@strands_tool
+def validate_batch(records: list[dict], rules: dict) -> list[dict]:
+    """Create validation reports for many records against the same rules.
+
+    The rules are compiled once and reused for every record, so this is
+    faster than calling create_validation_report in a loop.
+
+    Args:
+        records: List of dictionaries to validate
+        rules: Dictionary of validation rules, as for create_validation_report
+
+    Returns:
+        One validation report per record, in input order
+
+    Raises:
+        TypeError: If records is not a list of dictionaries or rules is not
+            a dictionary
+
+    Example:
+        >>> records = [{"name": "Alice"}, {"age": 25}]
+        >>> reports = validate_batch(records, {"required": ["name"]})
+        >>> [report["valid"] for report in reports]
+        [True, False]
+    """
+    if not isinstance(records, list):
+        raise TypeError("records must be a list")
+
+    if not isinstance(rules, dict):
+        raise TypeError("rules must be a dictionary")
+
+    for index, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise TypeError(f"records[{index}] must be a dictionary")
+
+    validator = _get_rules_validator(rules)
+    return [validator(record) for record in records]
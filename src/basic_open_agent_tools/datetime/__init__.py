@@ -50,6 +50,7 @@ from .ranges import (
     get_quarter_dates,
     get_year_to_date_range,
     is_date_in_range,
+    is_dates_in_range,
 )
 from .timezone import (
     convert_timezone,
@@ -98,6 +99,7 @@ __all__ = [
     "get_quarter_dates",
     "get_year_to_date_range",
     "is_date_in_range",
+    "is_dates_in_range",
     # info.py
     "get_day_of_year",
     "get_days_in_month",
@@ -0,0 +1,172 @@
+"""Internal date parsing, calendar and timezone helpers for the datetime tools.
+
+Agents tend to ask about the same few dates and timezones over and over,
+so parsed dates and timezone lookups are memoized. date and ZoneInfo
+objects are immutable, which makes sharing a cached instance between
+callers safe.
+"""
+
+import calendar
+import re
+import zoneinfo
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional
+
+# Python 3.11+ fromisoformat also takes forms like "20250708" and
+# "2025-W28-2"; the tools document YYYY-MM-DD on every supported version
+_ISO_DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+_ISO_DATE_FORMAT = "%Y-%m-%d"
+
+_ISO_DATETIME = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}:[0-9]{2}")
+
+# Date and time separator for each strptime format fromisoformat can parse
+_ISO_DATETIME_FORMATS = {"%Y-%m-%dT%H:%M:%S": "T", "%Y-%m-%d %H:%M:%S": " "}
+
+# Zero-padded fields for the strptime directives of all-numeric date formats
+_NUMERIC_DIRECTIVES = {
+    "%Y": "(?P<year>[0-9]{4})",
+    "%m": "(?P<month>[0-9]{2})",
+    "%d": "(?P<day>[0-9]{2})",
+}
+_NUMERIC_FORMAT_TOKEN = re.compile(r"%[Ymd]|[-/.]")
+
+# Days per month in a common year; February gains a day in leap years
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+@lru_cache(maxsize=512)
+def parse_iso_date(date_string: str) -> date:
+    """Parse an ISO format (YYYY-MM-DD) date string.
+
+    Strings not shaped like YYYY-MM-DD are rejected before parsing.
+    Callers check that date_string is a str first and wrap the ValueError
+    in their own message. Failed parses are not cached.
+
+    Args:
+        date_string: The date string in ISO format
+
+    Returns:
+        The parsed date
+
+    Raises:
+        ValueError: If date_string is not a valid ISO format date
+    """
+    if not _ISO_DATE.fullmatch(date_string):
+        raise ValueError(f"Invalid isoformat string: {date_string!r}")
+    return date.fromisoformat(date_string)
+
+
+@lru_cache(maxsize=64)
+def _numeric_date_pattern(format_string: str) -> Optional["re.Pattern[str]"]:
+    """Internal helper compiling a format such as "%m/%d/%Y" to a regex.
+
+    Only formats made of %Y, %m and %d (each once) joined by "-", "/" or
+    "." are compiled; None is returned for any other format.
+    """
+    tokens = _NUMERIC_FORMAT_TOKEN.findall(format_string)
+    directives = sorted(token for token in tokens if token in _NUMERIC_DIRECTIVES)
+    if "".join(tokens) != format_string or directives != ["%Y", "%d", "%m"]:
+        return None
+    return re.compile(
+        "".join(_NUMERIC_DIRECTIVES.get(token, re.escape(token)) for token in tokens)
+    )
+
+
+def parse_date_with_format(date_string: str, format_string: str) -> date:
+    """Parse a date string with a strptime format.
+
+    The common "%Y-%m-%d" format goes through the cached fromisoformat
+    path first, and zero-padded "%Y-%m-%dT%H:%M:%S" or "%Y-%m-%d %H:%M:%S"
+    strings through datetime.fromisoformat. Zero-padded strings in other
+    numeric formats such as "%m/%d/%Y" are matched with a compiled regex.
+    strptime stays the fallback because it also accepts unpadded fields
+    such as "2025-7-8".
+
+    Args:
+        date_string: The date string to parse
+        format_string: The strptime format of date_string
+
+    Returns:
+        The parsed date
+
+    Raises:
+        ValueError: If date_string does not match format_string
+    """
+    if format_string == _ISO_DATE_FORMAT:
+        try:
+            return parse_iso_date(date_string)
+        except ValueError:
+            pass
+    elif format_string in _ISO_DATETIME_FORMATS:
+        if (
+            _ISO_DATETIME.fullmatch(date_string)
+            and date_string[10] == _ISO_DATETIME_FORMATS[format_string]
+        ):
+            try:
+                return datetime.fromisoformat(date_string).date()
+            except ValueError:
+                pass
+    else:
+        pattern = _numeric_date_pattern(format_string)
+        match = pattern.fullmatch(date_string) if pattern else None
+        if match:
+            try:
+                return date(int(match["year"]), int(match["month"]), int(match["day"]))
+            except ValueError:
+                pass
+    return datetime.strptime(date_string, format_string).date()
+
+
+def days_in_month(year: int, month: int) -> int:
+    """Return the number of days in a month.
+
+    Callers validate that month is 1-12; unlike calendar.monthrange this
+    does not also work out the weekday the month starts on.
+
+    Args:
+        year: The year (e.g., 2025)
+        month: The month (1-12)
+
+    Returns:
+        The number of days in the month (28-31)
+    """
+    if month == 2 and calendar.isleap(year):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+@lru_cache(maxsize=512)
+def _find_zone(name: str) -> Optional[zoneinfo.ZoneInfo]:
+    """Internal helper returning the zone for name, or None if there is none.
+
+    Unknown names are cached too, since each miss searches the timezone
+    database on disk.
+    """
+    try:
+        return zoneinfo.ZoneInfo(name)
+    except zoneinfo.ZoneInfoNotFoundError:
+        return None
+
+
+def get_zoneinfo(name: str) -> zoneinfo.ZoneInfo:
+    """Look up a timezone by IANA name.
+
+    ZoneInfo only keeps a handful of zones alive itself; this keeps every
+    recently used zone, and remembers unknown names.
+
+    Args:
+        name: The timezone name (e.g., "UTC", "America/New_York")
+
+    Returns:
+        The timezone
+
+    Raises:
+        ZoneInfoNotFoundError: If no timezone has that name
+        ValueError: If name is not a valid timezone key (e.g., an absolute path)
+    """
+    zone = _find_zone(name)
+    if zone is None:
+        raise zoneinfo.ZoneInfoNotFoundError(f"No time zone found with key {name}")
+    return zone
@@ -4,9 +4,13 @@ This module provides business day calculations and utilities using ISO format
 strings for consistent date representation.
 """
 
-from datetime import date, timedelta
+from datetime import timedelta
 
 from ..decorators import strands_tool
+from ._parsing import parse_iso_date
+
+# Days to the next business day, indexed by weekday() (Monday=0, Sunday=6)
+_NEXT_BUSINESS_DAY_DELTA = (1, 1, 1, 1, 3, 2, 1)
 
 
 @strands_tool
@@ -38,18 +42,12 @@ def get_next_business_day(date_string: str) -> str:
         raise TypeError("date_string must be a string")
 
     try:
-        current_date = date.fromisoformat(date_string)
+        current_date = parse_iso_date(date_string)
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format '{date_string}': {e}")
 
-    # Move to next day
-    next_date = current_date + timedelta(days=1)
-
-    # Find next business day (Monday=0, Sunday=6)
-    while next_date.weekday() > 4:  # Saturday=5, Sunday=6
-        next_date += timedelta(days=1)
-
-    return next_date.isoformat()
+    delta = _NEXT_BUSINESS_DAY_DELTA[current_date.weekday()]
+    return (current_date + timedelta(days=delta)).isoformat()
 
 
 @strands_tool
@@ -81,7 +79,7 @@ def is_business_day(date_string: str) -> bool:
         raise TypeError("date_string must be a string")
 
     try:
-        dt = date.fromisoformat(date_string)
+        dt = parse_iso_date(date_string)
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format '{date_string}': {e}")
 
@@ -5,9 +5,10 @@ user-friendly formats that are easy to read and understand.
 """
 
 import re
-from datetime import date, time
+from datetime import time
 
 from ..decorators import strands_tool
+from ._parsing import parse_iso_date
 
 
 @strands_tool
@@ -40,7 +41,7 @@ def format_date_human_readable(date_string: str) -> str:
         raise TypeError("date_string must be a string")
 
     try:
-        parsed_date = date.fromisoformat(date_string)
+        parsed_date = parse_iso_date(date_string)
         return parsed_date.strftime("%B %d, %Y")
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format '{date_string}': {e}")
@@ -5,9 +5,52 @@ using ISO format strings for consistent date/time representation.
 """
 
 import calendar
-from datetime import date
+from functools import lru_cache
 
 from ..decorators import strands_tool
+from ._parsing import days_in_month, parse_iso_date
+
+# English names indexed by weekday() and month - 1; strftime would follow
+# the process locale
+_WEEKDAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+_MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+@lru_cache(maxsize=512)
+def _date_info(date_string: str) -> tuple[str, str, int, int]:
+    """Internal helper returning (weekday name, month name, ISO week, day of year).
+
+    All four are computed together so asking several of these questions
+    about the same date only derives them once.
+    """
+    dt = parse_iso_date(date_string)
+    return (
+        _WEEKDAY_NAMES[dt.weekday()],
+        _MONTH_NAMES[dt.month - 1],
+        dt.isocalendar()[1],
+        dt.timetuple().tm_yday,
+    )
 
 
 @strands_tool
@@ -33,8 +76,7 @@ def get_weekday_name(date_string: str) -> str:
         raise TypeError("date_string must be a string")
 
     try:
-        dt = date.fromisoformat(date_string)
-        return dt.strftime("%A")
+        return _date_info(date_string)[0]
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format '{date_string}': {e}")
 
@@ -62,8 +104,7 @@ def get_month_name(date_string: str) -> str:
         raise TypeError("date_string must be a string")
 
     try:
-        dt = date.fromisoformat(date_string)
-        return dt.strftime("%B")
+        return _date_info(date_string)[1]
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format '{date_string}': {e}")
 
@@ -91,8 +132,7 @@ def get_week_number(date_string: str) -> int:
         raise TypeError("date_string must be a string")
 
     try:
-        dt = date.fromisoformat(date_string)
-        return dt.isocalendar()[1]
+        return _date_info(date_string)[2]
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format '{date_string}': {e}")
 
@@ -120,8 +160,7 @@ def get_day_of_year(date_string: str) -> int:
         raise TypeError("date_string must be a string")
 
     try:
-        dt = date.fromisoformat(date_string)
-        return dt.timetuple().tm_yday
+        return _date_info(date_string)[3]
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format '{date_string}': {e}")
 
@@ -184,4 +223,4 @@ def get_days_in_month(year: int, month: int) -> int:
     if month < 1 or month > 12:
         raise ValueError("month must be between 1 and 12")
 
-    return calendar.monthrange(year, month)[1]
+    return days_in_month(year, month)
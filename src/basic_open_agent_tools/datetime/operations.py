@@ -4,10 +4,10 @@ This module provides fundamental date and time operations using ISO format strin
 All functions are designed to be agent-friendly with clear error handling.
 """
 
-import zoneinfo
 from datetime import date, datetime, time, timedelta
 
 from ..decorators import strands_tool
+from ._parsing import get_zoneinfo, parse_date_with_format, parse_iso_date
 
 
 @strands_tool
@@ -36,7 +36,7 @@ def get_current_datetime(timezone: str) -> str:
         raise TypeError("timezone must be a string")
 
     try:
-        tz = zoneinfo.ZoneInfo(timezone)
+        tz = get_zoneinfo(timezone)
         now = datetime.now(tz)
         return now.isoformat()
     except Exception as e:
@@ -69,7 +69,7 @@ def get_current_date(timezone: str) -> str:
         raise TypeError("timezone must be a string")
 
     try:
-        tz = zoneinfo.ZoneInfo(timezone)
+        tz = get_zoneinfo(timezone)
         now = datetime.now(tz)
         return now.date().isoformat()
     except Exception as e:
@@ -102,7 +102,7 @@ def get_current_time(timezone: str) -> str:
         raise TypeError("timezone must be a string")
 
     try:
-        tz = zoneinfo.ZoneInfo(timezone)
+        tz = get_zoneinfo(timezone)
         now = datetime.now(tz)
         return now.time().isoformat()
     except Exception as e:
@@ -137,7 +137,7 @@ def is_valid_iso_date(date_string: str) -> bool:
         raise TypeError("date_string must be a string")
 
     try:
-        date.fromisoformat(date_string)
+        parse_iso_date(date_string)
         return True
     except ValueError:
         return False
@@ -243,7 +243,7 @@ def add_days(date_string: str, days: int) -> str:
         raise TypeError("days must be an integer")
 
     try:
-        original_date = date.fromisoformat(date_string)
+        original_date = parse_iso_date(date_string)
         new_date = original_date + timedelta(days=days)
         return new_date.isoformat()
     except ValueError as e:
@@ -284,7 +284,7 @@ def subtract_days(date_string: str, days: int) -> str:
         raise ValueError("days must be positive (use add_days for negative values)")
 
     try:
-        original_date = date.fromisoformat(date_string)
+        original_date = parse_iso_date(date_string)
         new_date = original_date - timedelta(days=days)
         return new_date.isoformat()
     except ValueError as e:
@@ -355,6 +355,11 @@ def subtract_minutes(datetime_string: str, minutes: int) -> str:
         raise ValueError(f"Invalid ISO datetime format '{datetime_string}': {e}")
 
 
+def _microseconds_since_midnight(t: time) -> int:
+    """Internal helper converting a time of day to microseconds since midnight."""
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
 @strands_tool
 def calculate_time_difference(time1: str, time2: str, unit: str) -> int:
     """Calculate difference between two times in specified unit."""
@@ -372,13 +377,19 @@ def calculate_time_difference(time1: str, time2: str, unit: str) -> int:
         t1 = time.fromisoformat(time1)
         t2 = time.fromisoformat(time2)
 
-        # Convert to datetime objects for timedelta calculation
-        base_date = date.today()
-        dt1 = datetime.combine(base_date, t1)
-        dt2 = datetime.combine(base_date, t2)
+        if t1.tzinfo is None and t2.tzinfo is None:
+            # Naive times: plain integer arithmetic on microseconds
+            start_us = _microseconds_since_midnight(t1)
+            end_us = _microseconds_since_midnight(t2)
+            total_seconds = int((end_us - start_us) / 1_000_000)
+        else:
+            # Convert to datetime objects so UTC offsets are applied
+            base_date = date.today()
+            dt1 = datetime.combine(base_date, t1)
+            dt2 = datetime.combine(base_date, t2)
 
-        delta = dt2 - dt1
-        total_seconds = int(delta.total_seconds())
+            delta = dt2 - dt1
+            total_seconds = int(delta.total_seconds())
 
         if unit == "seconds":
             return total_seconds
@@ -424,7 +435,7 @@ def parse_date_string(date_string: str, format_string: str) -> str:
         raise TypeError("format_string must be a string")
 
     try:
-        parsed_date = datetime.strptime(date_string, format_string).date()
+        parsed_date = parse_date_with_format(date_string, format_string)
         return parsed_date.isoformat()
     except ValueError as e:
         raise ValueError(
@@ -469,9 +480,9 @@ def format_date(date_string: str, input_format: str, output_format: str) -> str:
     try:
         # Handle "iso" as a special input format
         if input_format.lower() == "iso":
-            parsed_date = date.fromisoformat(date_string)
+            parsed_date = parse_iso_date(date_string)
         else:
-            parsed_date = datetime.strptime(date_string, input_format).date()
+            parsed_date = parse_date_with_format(date_string, input_format)
 
         # Format the output
         return parsed_date.strftime(output_format)
@@ -5,9 +5,34 @@ periods, and business day calculations. All functions use ISO format strings
 for consistent date/time representation.
 """
 
-from datetime import date, timedelta
+from datetime import date
+from functools import lru_cache
 
 from ..decorators import strands_tool
+from ._parsing import days_in_month, parse_iso_date
+
+# Business days among the first N days (N < 7) of a run starting on a
+# given weekday, indexed [start weekday][N] (Monday=0, Sunday=6)
+_PARTIAL_WEEK_BUSINESS_DAYS = tuple(
+    tuple(
+        sum(1 for offset in range(extra_days) if (weekday + offset) % 7 < 5)
+        for extra_days in range(7)
+    )
+    for weekday in range(7)
+)
+
+
+@lru_cache(maxsize=512)
+def _month_span(year: int, start_month: int, end_month: int) -> tuple[str, str]:
+    """Internal helper returning the ISO first and last days of a month span.
+
+    Cached as an immutable tuple; callers build a fresh dict from it so a
+    caller mutating its result cannot affect later calls.
+    """
+    start_date = date(year, start_month, 1)
+    end_date = date(year, end_month, days_in_month(year, end_month))
+
+    return start_date.isoformat(), end_date.isoformat()
 
 
 @strands_tool
@@ -39,21 +64,18 @@ def get_date_range(start_date: str, end_date: str) -> list[str]:
         raise TypeError("end_date must be a string")
 
     try:
-        start = date.fromisoformat(start_date)
-        end = date.fromisoformat(end_date)
+        start = parse_iso_date(start_date)
+        end = parse_iso_date(end_date)
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format: {e}")
 
     if start > end:
         raise ValueError("start_date must be less than or equal to end_date")
 
-    dates = []
-    current = start
-    while current <= end:
-        dates.append(current.isoformat())
-        current += timedelta(days=1)
-
-    return dates
+    return [
+        date.fromordinal(ordinal).isoformat()
+        for ordinal in range(start.toordinal(), end.toordinal() + 1)
+    ]
 
 
 @strands_tool
@@ -87,18 +109,8 @@ def get_quarter_dates(year: int, quarter: int) -> dict[str, str]:
     if quarter not in [1, 2, 3, 4]:
         raise ValueError("quarter must be 1, 2, 3, or 4")
 
-    quarter_months = {1: (1, 3), 2: (4, 6), 3: (7, 9), 4: (10, 12)}
-
-    start_month, end_month = quarter_months[quarter]
-    start_date = date(year, start_month, 1)
-
-    # Get last day of end month
-    if end_month == 12:
-        end_date = date(year + 1, 1, 1) - timedelta(days=1)
-    else:
-        end_date = date(year, end_month + 1, 1) - timedelta(days=1)
-
-    return {"start": start_date.isoformat(), "end": end_date.isoformat()}
+    start, end = _month_span(year, quarter * 3 - 2, quarter * 3)
+    return {"start": start, "end": end}
 
 
 @strands_tool
@@ -127,7 +139,7 @@ def get_year_to_date_range(reference_date: str) -> dict[str, str]:
         raise TypeError("reference_date must be a string")
 
     try:
-        ref_date = date.fromisoformat(reference_date)
+        ref_date = parse_iso_date(reference_date)
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format: {e}")
 
@@ -168,12 +180,11 @@ def get_days_ago(days: int, reference_date: str) -> str:
         raise ValueError("days must be positive")
 
     try:
-        ref_date = date.fromisoformat(reference_date)
+        ref_date = parse_iso_date(reference_date)
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format: {e}")
 
-    target_date = ref_date - timedelta(days=days)
-    return target_date.isoformat()
+    return date.fromordinal(ref_date.toordinal() - days).isoformat()
 
 
 @strands_tool
@@ -208,30 +219,20 @@ def get_months_ago(months: int, reference_date: str) -> str:
         raise ValueError("months must be positive")
 
     try:
-        ref_date = date.fromisoformat(reference_date)
+        ref_date = parse_iso_date(reference_date)
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format: {e}")
 
-    # Calculate target year and month
-    target_year = ref_date.year
-    target_month = ref_date.month - months
-
-    # Handle year rollover
-    while target_month <= 0:
-        target_month += 12
-        target_year -= 1
+    # Calculate target year and month, rolling back over year boundaries
+    target_year, target_month = divmod(
+        ref_date.year * 12 + ref_date.month - 1 - months, 12
+    )
+    target_month += 1
 
-    # Handle day overflow (e.g., Jan 31 -> Feb 31 doesn't exist)
-    try:
-        target_date = date(target_year, target_month, ref_date.day)
-    except ValueError:
-        # If day doesn't exist in target month, use last day of target month
-        if target_month == 12:
-            target_date = date(target_year + 1, 1, 1) - timedelta(days=1)
-        else:
-            target_date = date(target_year, target_month + 1, 1) - timedelta(days=1)
+    # Clamp day overflow (e.g., Mar 31 -> Feb 31 doesn't exist)
+    target_day = min(ref_date.day, days_in_month(target_year, target_month))
 
-    return target_date.isoformat()
+    return date(target_year, target_month, target_day).isoformat()
 
 
 @strands_tool
@@ -260,16 +261,16 @@ def get_last_business_day(reference_date: str) -> str:
         raise TypeError("reference_date must be a string")
 
     try:
-        ref_date = date.fromisoformat(reference_date)
+        ref_date = parse_iso_date(reference_date)
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format: {e}")
 
-    # Find the last business day (Monday=0, Sunday=6)
-    current_date = ref_date
-    while current_date.weekday() > 4:  # Saturday=5, Sunday=6
-        current_date -= timedelta(days=1)
+    # Step back to Friday from a weekend (Monday=0, Sunday=6)
+    weekday = ref_date.weekday()
+    if weekday > 4:  # Saturday=5, Sunday=6
+        ref_date = date.fromordinal(ref_date.toordinal() - (weekday - 4))
 
-    return current_date.isoformat()
+    return ref_date.isoformat()
 
 
 @strands_tool
@@ -304,15 +305,62 @@ def is_date_in_range(check_date: str, start_date: str, end_date: str) -> bool:
         raise TypeError("end_date must be a string")
 
     try:
-        check = date.fromisoformat(check_date)
-        start = date.fromisoformat(start_date)
-        end = date.fromisoformat(end_date)
+        check = parse_iso_date(check_date)
+        start = parse_iso_date(start_date)
+        end = parse_iso_date(end_date)
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format: {e}")
 
     return start <= check <= end
 
 
+@strands_tool
+def is_dates_in_range(
+    check_dates: list[str], start_date: str, end_date: str
+) -> list[bool]:
+    """Check whether each of several dates falls within a range (inclusive).
+
+    The range bounds are parsed once for the whole list, so this is
+    faster than calling is_date_in_range for each date.
+
+    Args:
+        check_dates: List of dates to check in ISO format (YYYY-MM-DD)
+        start_date: The start date in ISO format (YYYY-MM-DD)
+        end_date: The end date in ISO format (YYYY-MM-DD)
+
+    Returns:
+        One result per date in check_dates, in input order
+
+    Raises:
+        TypeError: If check_dates is not a list of strings or a bound is
+            not a string
+        ValueError: If any date is not valid ISO format
+
+    Example:
+        >>> dates = ["2025-04-30", "2025-05-15"]
+        >>> result = is_dates_in_range(dates, "2025-05-01", "2025-05-31")
+        >>> result
+        [False, True]
+    """
+    if not isinstance(check_dates, list):
+        raise TypeError("check_dates must be a list")
+    if not isinstance(start_date, str):
+        raise TypeError("start_date must be a string")
+    if not isinstance(end_date, str):
+        raise TypeError("end_date must be a string")
+
+    for index, check_date in enumerate(check_dates):
+        if not isinstance(check_date, str):
+            raise TypeError(f"check_dates[{index}] must be a string")
+
+    try:
+        start = parse_iso_date(start_date)
+        end = parse_iso_date(end_date)
+        return [start <= parse_iso_date(check) <= end for check in check_dates]
+    except ValueError as e:
+        raise ValueError(f"Invalid ISO date format: {e}")
+
+
 @strands_tool
 def get_month_range(year: int, month: int) -> dict[str, str]:
     """Get the start and end dates for a specific month.
@@ -344,15 +392,8 @@ def get_month_range(year: int, month: int) -> dict[str, str]:
     if month < 1 or month > 12:
         raise ValueError("month must be between 1 and 12")
 
-    start_date = date(year, month, 1)
-
-    # Get last day of month
-    if month == 12:
-        end_date = date(year + 1, 1, 1) - timedelta(days=1)
-    else:
-        end_date = date(year, month + 1, 1) - timedelta(days=1)
-
-    return {"start": start_date.isoformat(), "end": end_date.isoformat()}
+    start, end = _month_span(year, month, month)
+    return {"start": start, "end": end}
 
 
 @strands_tool
@@ -384,8 +425,8 @@ def calculate_days_between(start_date: str, end_date: str) -> int:
         raise TypeError("end_date must be a string")
 
     try:
-        start = date.fromisoformat(start_date)
-        end = date.fromisoformat(end_date)
+        start = parse_iso_date(start_date)
+        end = parse_iso_date(end_date)
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format: {e}")
 
@@ -421,20 +462,17 @@ def get_business_days_in_range(start_date: str, end_date: str) -> int:
         raise TypeError("end_date must be a string")
 
     try:
-        start = date.fromisoformat(start_date)
-        end = date.fromisoformat(end_date)
+        start = parse_iso_date(start_date)
+        end = parse_iso_date(end_date)
     except ValueError as e:
         raise ValueError(f"Invalid ISO date format: {e}")
 
     if start > end:
         raise ValueError("start_date must be less than or equal to end_date")
 
-    business_days = 0
-    current = start
-
-    while current <= end:
-        if current.weekday() < 5:  # Monday=0, Friday=4
-            business_days += 1
-        current += timedelta(days=1)
+    # Every full week holds five business days; the leftover days (fewer
+    # than seven) are looked up by the weekday they start on
+    full_weeks, extra_days = divmod((end - start).days + 1, 7)
+    extra_business_days = _PARTIAL_WEEK_BUSINESS_DAYS[start.weekday()][extra_days]
 
-    return business_days
+    return full_weeks * 5 + extra_business_days
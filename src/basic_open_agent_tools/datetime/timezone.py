@@ -7,11 +7,7 @@ strings and standard timezone names.
 from datetime import datetime
 
 from ..decorators import strands_tool
-
-try:
-    import zoneinfo
-except ImportError:
-    import pytz as zoneinfo  # type: ignore
+from ._parsing import get_zoneinfo
 
 
 @strands_tool
@@ -45,8 +41,8 @@ def convert_timezone(datetime_string: str, from_timezone: str, to_timezone: str)
         raise TypeError("to_timezone must be a string")
 
     try:
-        from_tz = zoneinfo.ZoneInfo(from_timezone)
-        to_tz = zoneinfo.ZoneInfo(to_timezone)
+        from_tz = get_zoneinfo(from_timezone)
+        to_tz = get_zoneinfo(to_timezone)
 
         # Parse datetime and localize to source timezone
         dt = datetime.fromisoformat(datetime_string)
@@ -85,8 +81,18 @@ def get_timezone_offset(timezone: str) -> str:
         raise TypeError("timezone must be a string")
 
     try:
-        tz = zoneinfo.ZoneInfo(timezone)
+        tz = get_zoneinfo(timezone)
         now = datetime.now(tz)
+
+        # Whole-minute offsets (every current zone) are formatted directly;
+        # strftime costs several times more than the lookup itself
+        utc_offset = now.utcoffset()
+        if utc_offset is not None and not utc_offset.total_seconds() % 60:
+            offset_minutes = int(utc_offset.total_seconds()) // 60
+            sign = "-" if offset_minutes < 0 else "+"
+            hours, minutes = divmod(abs(offset_minutes), 60)
+            return f"{sign}{hours:02d}:{minutes:02d}"
+
         offset = now.strftime("%z")
 
         # Format as +HH:MM or -HH:MM
@@ -126,7 +132,7 @@ def is_daylight_saving_time(datetime_string: str, timezone: str) -> bool:
         raise TypeError("timezone must be a string")
 
     try:
-        tz = zoneinfo.ZoneInfo(timezone)
+        tz = get_zoneinfo(timezone)
         dt = datetime.fromisoformat(datetime_string)
         dt_localized = dt.replace(tzinfo=tz)
 
@@ -161,7 +167,7 @@ def is_valid_timezone(timezone_string: str) -> bool:
         raise TypeError("timezone_string must be a string")
 
     try:
-        zoneinfo.ZoneInfo(timezone_string)
+        get_zoneinfo(timezone_string)
         return True
     except Exception:
         return False
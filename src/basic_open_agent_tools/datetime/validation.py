@@ -4,9 +4,10 @@ This module provides validation functions for dates, times, and ranges using ISO
 format strings for consistent validation.
 """
 
-from datetime import date, datetime
+from datetime import datetime
 
 from ..decorators import strands_tool
+from ._parsing import parse_date_with_format, parse_iso_date
 
 
 @strands_tool
@@ -43,9 +44,9 @@ def validate_date_range(date_string: str, min_date: str, max_date: str) -> bool:
         raise TypeError("max_date must be a string")
 
     try:
-        target_date = date.fromisoformat(date_string)
-        min_dt = date.fromisoformat(min_date)
-        max_dt = date.fromisoformat(max_date)
+        target_date = parse_iso_date(date_string)
+        min_dt = parse_iso_date(min_date)
+        max_dt = parse_iso_date(max_date)
 
         return min_dt <= target_date <= max_dt
     except ValueError as e:
@@ -124,7 +125,7 @@ def is_valid_date_format(date_string: str, format_string: str) -> bool:
         raise TypeError("format_string must be a string")
 
     try:
-        datetime.strptime(date_string, format_string)
+        parse_date_with_format(date_string, format_string)
         return True
     except ValueError:
         return False
@@ -159,8 +160,8 @@ def is_future_date(date_string: str, reference_date: str) -> bool:
         raise TypeError("reference_date must be a string")
 
     try:
-        target_date = date.fromisoformat(date_string)
-        ref_date = date.fromisoformat(reference_date)
+        target_date = parse_iso_date(date_string)
+        ref_date = parse_iso_date(reference_date)
 
         return target_date > ref_date
     except ValueError as e:
@@ -196,8 +197,8 @@ def is_past_date(date_string: str, reference_date: str) -> bool:
         raise TypeError("reference_date must be a string")
 
     try:
-        target_date = date.fromisoformat(date_string)
-        ref_date = date.fromisoformat(reference_date)
+        target_date = parse_iso_date(date_string)
+        ref_date = parse_iso_date(reference_date)
 
         return target_date < ref_date
     except ValueError as e:
@@ -569,7 +569,7 @@ def load_data_validation_tools() -> list[Callable[..., Any]]:
 
     Example:
         >>> validation_tools = load_data_validation_tools()
-        >>> len(validation_tools) == 5
+        >>> len(validation_tools) == 6
         True
     """
     from .data import validation
@@ -581,6 +581,7 @@ def load_data_validation_tools() -> list[Callable[..., Any]]:
         "validate_data_types_simple",
         "validate_range_simple",
         "create_validation_report",
+        "validate_batch",
     ]
 
     for name in validation_function_names:
@@ -956,7 +957,7 @@ def load_analyst_tools() -> list[Callable[..., Any]]:
     """
     tools = []
 
-    # All data validation tools (5 tools)
+    # All data validation tools (6 tools)
     tools.extend(load_data_validation_tools())
 
     # All CSV tools for analysis (7 tools)
@@ -1357,7 +1358,7 @@ def load_data_analyst_loadout() -> list[Callable[..., Any]]:
     Includes (~115 tools):
     - Excel: Spreadsheet operations, formulas, charts (24 tools)
     - CSV: Reading, writing, validation (7 tools)
-    - Data validation: Schema checking, type validation (5 tools)
+    - Data validation: Schema checking, type validation (6 tools)
     - Diagrams: Charts, graphs, visualizations (16 tools)
     - Structured data: JSON, YAML, TOML, XML (42 tools)
     - File system: All operations (18 tools)
@@ -1383,7 +1384,7 @@ def load_data_analyst_loadout() -> list[Callable[..., Any]]:
     # Data analysis tools
     tools.extend(load_all_excel_tools())  # 24
     tools.extend(load_data_csv_tools())  # 7
-    tools.extend(load_data_validation_tools())  # 5
+    tools.extend(load_data_validation_tools())  # 6
     tools.extend(load_all_diagrams_tools())  # 16
 
     # Structured data
@@ -139,11 +139,14 @@ class TestAdkCompatibility:
             sig = inspect.signature(tool)
 
             # Check no parameters have default values (Google ADK requirement)
-            for param_name, param in sig.parameters.items():
-                if param_name != "self":
-                    assert param.default == inspect.Parameter.empty, (
-                        f"Tool {tool.__name__} parameter {param_name} has default value (not allowed for Google ADK)"
-                    )
+            defaulted = [
+                param_name
+                for param_name, param in sig.parameters.items()
+                if param_name != "self" and param.default is not inspect.Parameter.empty
+            ]
+            assert not defaulted, (
+                f"Tool {tool.__name__} parameters {defaulted} have default values (not allowed for Google ADK)"
+            )
 
             # Check parameter types are JSON-serializable (basic check)
             for param_name, param in sig.parameters.items():
@@ -1,10 +1,77 @@
 """Global pytest configuration for rate limiting."""
 
+import asyncio
 import os
+import time
 
 import pytest
 
 
+class AsyncRateLimiter:
+    """Token bucket allowing ``max_rate`` acquisitions per ``time_period`` seconds.
+
+    Only monotonic timestamps and ``asyncio.sleep`` are used, so one instance
+    can be shared across tests that each run on their own event loop.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0) -> None:
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = max_rate
+        self._last_refill = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(
+            self.max_rate,
+            self._tokens + elapsed * self.max_rate / self.time_period,
+        )
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        self._refill()
+        while self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) * self.time_period / self.max_rate)
+            self._refill()
+        self._tokens -= 1
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+def _fast_write(path: os.PathLike, content: str) -> None:
+    """Write small UTF-8 fixture files with a bare open/write/close."""
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(os.fspath(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def fast_write():
+    """Provide an unbuffered file writer for building test fixture files."""
+    return _fast_write
+
+
+@pytest.fixture(scope="session")
+def agent_rate_limiter():
+    """Share one API rate limit across all agent evaluation tests.
+
+    Defaults to the Gemini free tier of 15 requests/minute; override with
+    PYTEST_AGENT_RATE_LIMIT (requests per minute).
+    """
+    return AsyncRateLimiter(float(os.getenv("PYTEST_AGENT_RATE_LIMIT", "15")))
+
+
 @pytest.fixture(autouse=True, scope="function")
 def rate_limit_delay(request):
     """Add configurable delay only for agent evaluation tests to prevent API rate limiting."""
@@ -13,6 +80,4 @@ def rate_limit_delay(request):
     if request.node.get_closest_marker("agent_evaluation"):
         delay = float(os.getenv("PYTEST_API_DELAY", "5"))
         if delay > 0:
-            import time
-
             time.sleep(delay)
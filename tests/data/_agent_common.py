@@ -0,0 +1,58 @@
+"""Shared construction helpers for the data tools ADK evaluation agents."""
+
+import functools
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from dotenv import load_dotenv
+from google.adk.agents import Agent
+
+_LOADED = False
+
+
+@functools.cache
+def _project_root() -> Path:
+    """Return the repository root (tests/data/_agent_common.py -> root)."""
+    return Path(__file__).resolve().parents[2]
+
+
+def _load_env_once() -> None:
+    """Load API keys from the project .env file the first time it is needed."""
+    global _LOADED
+    if _LOADED:
+        return
+    # override=False keeps variables that are already set in the environment
+    load_dotenv(_project_root() / ".env", override=False)
+    _LOADED = True
+
+
+def build_agent(
+    *,
+    name: str,
+    description: str,
+    instruction: str,
+    tools: list[Callable[..., Any]],
+    model: Optional[str] = None,
+) -> Agent:
+    """Build an evaluation agent for a data tools module.
+
+    Args:
+        name: Agent name reported to the evaluator
+        description: Short description of the agent's capabilities
+        instruction: System instruction for the agent
+        tools: Tool functions exposed to the agent
+        model: Model name; defaults to GOOGLE_MODEL_NAME or gemini-1.5-flash
+
+    Returns:
+        Configured ADK Agent instance
+    """
+    _load_env_once()
+
+    return Agent(
+        name=name,
+        model=model or os.environ.get("GOOGLE_MODEL_NAME", "gemini-1.5-flash"),
+        description=description,
+        instruction=instruction,
+        tools=tools,
+    )
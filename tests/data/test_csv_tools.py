@@ -1,6 +1,8 @@
 """Tests for basic_open_agent_tools.data.csv_tools module."""
 
+import copy
 from pathlib import Path
+from typing import Any, Callable
 
 import pytest
 
@@ -15,6 +17,65 @@ from basic_open_agent_tools.data.csv_tools import (
 )
 from basic_open_agent_tools.exceptions import DataError
 
+# Positional arguments following file_path for each file-based reader
+FILE_READER_CASES = [
+    (read_csv_simple, (",", True)),
+    (detect_csv_delimiter, (1000,)),
+    (validate_csv_structure, (["name"],)),
+]
+
+# Expected result of each non-raising file-based reader on an empty file
+EMPTY_FILE_CASES = [
+    (read_csv_simple, (",", True), []),
+    (read_csv_simple, (",", False), []),
+    (validate_csv_structure, (["name", "age"],), True),
+]
+
+LARGE_CSV_ROWS = 60000
+
+
+@pytest.fixture(scope="session")
+def large_csv(
+    tmp_path_factory: pytest.TempPathFactory, fast_write: Callable[[Path, str], None]
+) -> Path:
+    """Write a CSV larger than the 1 MiB read buffer once per session."""
+    csv_file = tmp_path_factory.mktemp("csv") / "large.csv"
+    fast_write(
+        csv_file,
+        "id,name,city\n"
+        + "".join(f"{i},user_{i},City {i % 50}\n" for i in range(LARGE_CSV_ROWS)),
+    )
+    return csv_file
+
+
+class TestCsvFileSanityChecks:
+    """Shared sanity checks for functions that read CSV files from disk."""
+
+    @pytest.mark.parametrize("fn,args", FILE_READER_CASES)
+    def test_file_not_found(self, fn: Callable[..., Any], args: tuple) -> None:
+        """Test error handling when CSV file doesn't exist."""
+        with pytest.raises(DataError, match="CSV file not found"):
+            fn("nonexistent.csv", *args)
+
+    @pytest.mark.parametrize("fn,args", FILE_READER_CASES)
+    @pytest.mark.parametrize("bad_path", [123, None])
+    def test_invalid_file_path_type(
+        self, fn: Callable[..., Any], args: tuple, bad_path: Any
+    ) -> None:
+        """Test error handling for invalid file_path type."""
+        with pytest.raises(TypeError, match="file_path must be a string"):
+            fn(bad_path, *args)
+
+    @pytest.mark.parametrize("fn,args,expected", EMPTY_FILE_CASES)
+    def test_empty_file(
+        self, tmp_path: Path, fn: Callable[..., Any], args: tuple, expected: Any
+    ) -> None:
+        """Test that empty files are accepted by non-detecting readers."""
+        csv_file = tmp_path / "empty.csv"
+        csv_file.write_text("", encoding="utf-8")
+
+        assert fn(str(csv_file), *args) == expected
+
 
 class TestReadCsvSimple:
     """Test cases for read_csv_simple function."""
@@ -61,17 +122,6 @@ class TestReadCsvSimple:
         ]
         assert result == expected
 
-    def test_read_empty_csv_file(self, tmp_path: Path) -> None:
-        """Test reading empty CSV file."""
-        csv_file = tmp_path / "empty.csv"
-        csv_file.write_text("", encoding="utf-8")
-
-        result = read_csv_simple(str(csv_file), ",", True)
-        assert result == []
-
-        result = read_csv_simple(str(csv_file), ",", False)
-        assert result == []
-
     def test_read_csv_with_only_headers(self, tmp_path: Path) -> None:
         """Test reading CSV with only header row."""
         csv_file = tmp_path / "headers_only.csv"
@@ -112,18 +162,18 @@ class TestReadCsvSimple:
         ]
         assert result == expected
 
-    def test_read_csv_file_not_found(self) -> None:
-        """Test error handling when CSV file doesn't exist."""
-        with pytest.raises(DataError, match="CSV file not found"):
-            read_csv_simple("nonexistent.csv", ",", True)
+    def test_read_large_csv_file(self, large_csv: Path) -> None:
+        """Test reading a multi-megabyte CSV spanning several read buffers."""
+        assert large_csv.stat().st_size > 1 << 20
 
-    def test_read_csv_invalid_file_path_type(self) -> None:
-        """Test error handling for invalid file_path type."""
-        with pytest.raises(TypeError, match="file_path must be a string"):
-            read_csv_simple(123, ",", True)  # type: ignore[arg-type]
+        result = read_csv_simple(str(large_csv), ",", True)
+        assert len(result) == LARGE_CSV_ROWS
+        assert result[0] == {"id": "0", "name": "user_0", "city": "City 0"}
+        assert result[-1]["id"] == str(LARGE_CSV_ROWS - 1)
 
-        with pytest.raises(TypeError, match="file_path must be a string"):
-            read_csv_simple(None, ",", True)  # type: ignore[arg-type]
+        result = read_csv_simple(str(large_csv), ",", False)
+        assert len(result) == LARGE_CSV_ROWS + 1
+        assert result[0] == {"col_0": "id", "col_1": "name", "col_2": "city"}
 
     def test_read_csv_invalid_delimiter_type(self, tmp_path: Path) -> None:
         """Test error handling for invalid delimiter type."""
@@ -385,13 +435,9 @@ class TestDictListToCsv:
 
         result = dict_list_to_csv(data, ",")
 
-        # Parse result back to verify
-        lines = [line.strip() for line in result.strip().split("\n")]
-        assert (
-            "name,age,city" in lines or "name,city,age" in lines
-        )  # Header order may vary
-        assert "Alice,25,NYC" in result or "Alice,NYC,25" in result
-        assert "Bob,30,LA" in result or "Bob,LA,30" in result
+        # Parse result back once; header order may vary
+        parsed = [frozenset(row.items()) for row in csv_to_dict_list(result, ",")]
+        assert parsed == [frozenset(row.items()) for row in data]
 
     def test_dict_list_to_csv_with_delimiter(self) -> None:
         """Test CSV conversion with different delimiter."""
@@ -399,8 +445,8 @@ class TestDictListToCsv:
 
         result = dict_list_to_csv(data, ";")
 
-        assert "name;age" in result or "age;name" in result
-        assert "Alice;25" in result or "25;Alice" in result
+        parsed = [frozenset(row.items()) for row in csv_to_dict_list(result, ";")]
+        assert frozenset({("name", "Alice"), ("age", "25")}) in parsed
 
     def test_dict_list_to_csv_empty_data(self) -> None:
         """Test converting empty data."""
@@ -487,19 +533,30 @@ class TestDetectCsvDelimiter:
         result = detect_csv_delimiter(str(csv_file), 1000)
         assert result == "|"
 
-    def test_detect_delimiter_with_sample_size(self, tmp_path: Path) -> None:
+    def test_detect_delimiter_with_sample_size(self, large_csv: Path) -> None:
         """Test delimiter detection with limited sample size."""
-        csv_file = tmp_path / "large.csv"
-        csv_content = "name,age,city\n" + "Alice,25,NYC\n" * 1000 + "Bob,30,LA"
+        result = detect_csv_delimiter(str(large_csv), 50)  # Small sample
+        assert result == ","
+
+    def test_detect_delimiter_ignores_inconsistent_candidates(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that commas inside fields don't outvote a consistent delimiter."""
+        csv_file = tmp_path / "mixed.csv"
+        csv_content = "name;note\nAlice;a, b, c\nBob;d\nCarol;e, f"
         csv_file.write_text(csv_content, encoding="utf-8")
 
-        result = detect_csv_delimiter(str(csv_file), 50)  # Small sample
-        assert result == ","
+        result = detect_csv_delimiter(str(csv_file), 1000)
+        assert result == ";"
 
-    def test_detect_delimiter_file_not_found(self) -> None:
-        """Test error handling when file doesn't exist."""
-        with pytest.raises(DataError, match="CSV file not found"):
-            detect_csv_delimiter("nonexistent.csv", 1000)
+    def test_detect_delimiter_falls_back_to_sniffer(self, tmp_path: Path) -> None:
+        """Test that samples without a known candidate use csv.Sniffer."""
+        csv_file = tmp_path / "colon.csv"
+        csv_content = "name:age:city\nAlice:25:NYC\nBob:30:LA"
+        csv_file.write_text(csv_content, encoding="utf-8")
+
+        result = detect_csv_delimiter(str(csv_file), 1000)
+        assert result == ":"
 
     def test_detect_delimiter_empty_file(self, tmp_path: Path) -> None:
         """Test error handling for empty file."""
@@ -509,11 +566,6 @@ class TestDetectCsvDelimiter:
         with pytest.raises(DataError, match="File is empty, cannot detect delimiter"):
             detect_csv_delimiter(str(csv_file), 1000)
 
-    def test_detect_delimiter_invalid_file_path_type(self) -> None:
-        """Test error handling for invalid file_path type."""
-        with pytest.raises(TypeError, match="file_path must be a string"):
-            detect_csv_delimiter(123, 1000)  # type: ignore[arg-type]
-
     def test_detect_delimiter_invalid_sample_size_type(self, tmp_path: Path) -> None:
         """Test error handling for invalid sample_size type."""
         csv_file = tmp_path / "test.csv"
@@ -561,13 +613,20 @@ class TestValidateCsvStructure:
         with pytest.raises(DataError, match="Missing expected columns"):
             validate_csv_structure(str(csv_file), ["name", "age", "email"])
 
-    def test_validate_csv_structure_empty_file(self, tmp_path: Path) -> None:
-        """Test validation of empty file."""
-        csv_file = tmp_path / "empty.csv"
-        csv_file.write_text("", encoding="utf-8")
+    def test_validate_csv_structure_headers_only(self, tmp_path: Path) -> None:
+        """Test that a header row with no data rows is considered valid."""
+        csv_file = tmp_path / "headers_only.csv"
+        csv_file.write_text("name,age\n", encoding="utf-8")
 
-        result = validate_csv_structure(str(csv_file), ["name", "age"])
-        assert result is True  # Empty file is considered valid
+        result = validate_csv_structure(str(csv_file), ["name", "email"])
+        assert result is True
+
+    def test_validate_csv_structure_large_file(self, large_csv: Path) -> None:
+        """Test validation only needs the header and first row of a large file."""
+        assert validate_csv_structure(str(large_csv), ["name", "city"]) is True
+
+        with pytest.raises(DataError, match="Missing expected columns"):
+            validate_csv_structure(str(large_csv), ["email"])
 
     def test_validate_csv_structure_no_expected_columns(self, tmp_path: Path) -> None:
         """Test validation with no expected columns."""
@@ -578,16 +637,6 @@ class TestValidateCsvStructure:
         result = validate_csv_structure(str(csv_file), [])
         assert result is True
 
-    def test_validate_csv_structure_file_not_found(self) -> None:
-        """Test error handling when file doesn't exist."""
-        with pytest.raises(DataError, match="CSV file not found"):
-            validate_csv_structure("nonexistent.csv", ["name"])
-
-    def test_validate_csv_structure_invalid_file_path_type(self) -> None:
-        """Test error handling for invalid file_path type."""
-        with pytest.raises(TypeError, match="file_path must be a string"):
-            validate_csv_structure(123, ["name"])  # type: ignore[arg-type]
-
     def test_validate_csv_structure_invalid_expected_columns_type(
         self, tmp_path: Path
     ) -> None:
@@ -779,57 +828,89 @@ class TestCleanCsvData:
         assert result == expected
 
 
+WORKFLOW_DATA = [
+    {"name": "Alice", "age": "25", "city": "NYC"},
+    {"name": "Bob", "age": "30", "city": "LA"},
+]
+
+# Shared read-only input for the cleaning workflow; clean_csv_data never
+# mutates its input, so tests pass it without copying
+MESSY_DATA: tuple[dict[str, str], ...] = (
+    {"name": "  Alice  ", "age": "", "score": "N/A"},
+    {"name": "Bob", "age": " 30 ", "score": "95"},
+    {"name": "", "age": "25", "score": "null"},
+)
+
+CLEAN_RULES = {
+    "strip_whitespace": True,
+    "remove_empty": True,
+    "na_values": ["N/A", "null"],
+}
+
+UNICODE_DATA = [
+    {"name": "Alice", "city": "北京"},
+    {"name": "José", "city": "São Paulo"},
+    {"name": "Владимир", "city": "Москва"},
+]
+
+
+@pytest.fixture(scope="session")
+def workflow_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the workflow CSV once per session via write_csv_simple."""
+    csv_file = tmp_path_factory.mktemp("csv") / "workflow.csv"
+    write_csv_simple(WORKFLOW_DATA, str(csv_file), ",", True, skip_confirm=True)
+    return csv_file
+
+
+@pytest.fixture(scope="session")
+def unusual_csv(
+    tmp_path_factory: pytest.TempPathFactory, fast_write: Callable[[Path, str], None]
+) -> Path:
+    """Write an unusual but valid CSV file once per session."""
+    csv_file = tmp_path_factory.mktemp("csv") / "unusual.csv"
+    # Python CSV reader handles the unmatched quote
+    fast_write(csv_file, 'name,age\n"Alice,25\nBob,30')
+    return csv_file
+
+
+@pytest.fixture(scope="session")
+def unicode_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the Unicode CSV once per session via write_csv_simple."""
+    csv_file = tmp_path_factory.mktemp("csv") / "unicode.csv"
+    write_csv_simple(UNICODE_DATA, str(csv_file), ",", True, skip_confirm=True)
+    return csv_file
+
+
 # Integration tests
 class TestCsvToolsIntegration:
     """Integration tests for CSV tools working together."""
 
-    def test_complete_csv_workflow(self, tmp_path: Path) -> None:
+    def test_complete_csv_workflow(self, workflow_csv: Path) -> None:
         """Test complete CSV processing workflow."""
-        # Step 1: Create test data
-        original_data = [
-            {"name": "Alice", "age": "25", "city": "NYC"},
-            {"name": "Bob", "age": "30", "city": "LA"},
-        ]
-
-        # Step 2: Write to file
-        csv_file = tmp_path / "workflow.csv"
-        write_csv_simple(original_data, str(csv_file), ",", True, skip_confirm=True)
-
-        # Step 3: Detect delimiter
-        detected_delimiter = detect_csv_delimiter(str(csv_file), 1000)
+        # Step 1: Detect delimiter
+        detected_delimiter = detect_csv_delimiter(str(workflow_csv), 1000)
         assert detected_delimiter == ","
 
-        # Step 4: Validate structure
-        is_valid = validate_csv_structure(str(csv_file), ["name", "age"])
+        # Step 2: Validate structure
+        is_valid = validate_csv_structure(str(workflow_csv), ["name", "age"])
         assert is_valid is True
 
-        # Step 5: Read back
-        read_data = read_csv_simple(str(csv_file), detected_delimiter, True)
-        assert read_data == original_data
+        # Step 3: Read back
+        read_data = read_csv_simple(str(workflow_csv), detected_delimiter, True)
+        assert read_data == WORKFLOW_DATA
 
-        # Step 6: Convert to string and back
-        csv_string = dict_list_to_csv(read_data, detected_delimiter)
-        dict_data = csv_to_dict_list(csv_string, detected_delimiter)
-        assert dict_data == original_data
+    @pytest.mark.parametrize("data", [WORKFLOW_DATA, UNICODE_DATA])
+    def test_string_roundtrip(self, data: list[dict[str, str]]) -> None:
+        """Test in-memory CSV serialization symmetry without touching disk."""
+        csv_string = dict_list_to_csv(data, ",")
+        assert csv_to_dict_list(csv_string, ",") == data
 
     def test_csv_cleaning_workflow(self) -> None:
         """Test CSV data cleaning workflow."""
-        # Step 1: Create messy data
-        messy_data = [
-            {"name": "  Alice  ", "age": "", "score": "N/A"},
-            {"name": "Bob", "age": " 30 ", "score": "95"},
-            {"name": "", "age": "25", "score": "null"},
-        ]
-
-        # Step 2: Clean the data
-        clean_rules = {
-            "strip_whitespace": True,
-            "remove_empty": True,
-            "na_values": ["N/A", "null"],
-        }
-        cleaned_data = clean_csv_data(messy_data, clean_rules)
+        # Step 1: Clean the data
+        cleaned_data = clean_csv_data(list(MESSY_DATA), CLEAN_RULES)
 
-        # Step 3: Verify cleaning results
+        # Step 2: Verify cleaning results
         expected = [
             {"name": "Alice"},
             {"name": "Bob", "age": "30", "score": "95"},
@@ -837,46 +918,32 @@ class TestCsvToolsIntegration:
         ]
         assert cleaned_data == expected
 
-        # Step 4: Convert cleaned data to CSV string
+        # Step 3: Convert cleaned data to CSV string
         csv_string = dict_list_to_csv(cleaned_data, ",")
-        assert "Alice" in csv_string
-        assert "Bob,30,95" in csv_string or "30,Bob,95" in csv_string
+        parsed = [frozenset(row.items()) for row in csv_to_dict_list(csv_string, ",")]
+        assert frozenset({("name", "Alice"), ("age", ""), ("score", "")}) in parsed
+        assert frozenset({("name", "Bob"), ("age", "30"), ("score", "95")}) in parsed
 
-    def test_error_consistency_across_functions(self, tmp_path: Path) -> None:
-        """Test that functions handle unusual but valid CSV consistently."""
-        # Create unusual but valid CSV file
-        csv_file = tmp_path / "unusual.csv"
-        csv_content = 'name,age\n"Alice,25\nBob,30'  # Python CSV reader handles this
-        csv_file.write_text(csv_content, encoding="utf-8")
+    def test_csv_cleaning_does_not_mutate_input(self) -> None:
+        """Test that clean_csv_data leaves its input rows and rules untouched."""
+        data = copy.deepcopy(list(MESSY_DATA))
+        rules = copy.deepcopy(CLEAN_RULES)
 
+        clean_csv_data(data, rules)
+
+        assert data == list(MESSY_DATA)
+        assert rules == CLEAN_RULES
+
+    def test_error_consistency_across_functions(self, unusual_csv: Path) -> None:
+        """Test that functions handle unusual but valid CSV consistently."""
         # All functions should handle this consistently (not raise errors)
-        data = read_csv_simple(str(csv_file), ",", True)
+        data = read_csv_simple(str(unusual_csv), ",", True)
         assert len(data) == 1  # CSV reader treats this as one record
 
-        result = validate_csv_structure(str(csv_file), ["name", "age"])
+        result = validate_csv_structure(str(unusual_csv), ["name", "age"])
         assert result is True
 
-    def test_unicode_consistency_across_functions(self, tmp_path: Path) -> None:
-        """Test Unicode handling consistency across all functions."""
-        unicode_data = [
-            {"name": "Alice", "city": "北京"},
-            {"name": "José", "city": "São Paulo"},
-            {"name": "Владимир", "city": "Москва"},
-        ]
-
-        # Step 1: Write Unicode data
-        csv_file = tmp_path / "unicode.csv"
-        write_csv_simple(unicode_data, str(csv_file), ",", True, skip_confirm=True)
-
-        # Step 2: Read back
-        read_data = read_csv_simple(str(csv_file), ",", True)
-        assert read_data == unicode_data
-
-        # Step 3: Convert to string and back
-        csv_string = dict_list_to_csv(unicode_data, ",")
-        dict_data = csv_to_dict_list(csv_string, ",")
-        assert dict_data == unicode_data
-
-        # Step 4: Detect delimiter (should work with Unicode)
-        delimiter = detect_csv_delimiter(str(csv_file), 1000)
-        assert delimiter == ","
+    def test_unicode_file_roundtrip(self, unicode_csv: Path) -> None:
+        """Test Unicode data written by write_csv_simple reads back intact."""
+        read_data = read_csv_simple(str(unicode_csv), ",", True)
+        assert read_data == UNICODE_DATA
@@ -4,12 +4,6 @@ This module provides an AI agent that uses the basic_open_agent_tools
 CSV utilities for ADK evaluation testing.
 """
 
-import os
-from pathlib import Path
-
-from dotenv import load_dotenv
-from google.adk.agents import Agent
-
 from src.basic_open_agent_tools.data.csv_tools import (
     clean_csv_data,
     csv_to_dict_list,
@@ -19,15 +13,10 @@ from src.basic_open_agent_tools.data.csv_tools import (
     validate_csv_structure,
     write_csv_simple,
 )
+from tests.data._agent_common import build_agent
 
-# Load environment variables for API keys
-load_dotenv()  # From current working directory (when pytest runs from root)
-project_root = Path(__file__).parent.parent.parent.parent.parent
-load_dotenv(project_root / ".env")  # From project root
-
-root_agent = Agent(
+root_agent = build_agent(
     name="csv_tools_agent",
-    model=os.environ.get("GOOGLE_MODEL_NAME", "gemini-1.5-flash"),
     description="Agent that can process CSV files using the basic_open_agent_tools CSV utilities.",
     instruction="""You are a helpful agent that can work with CSV data.
 
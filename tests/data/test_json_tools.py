@@ -1,6 +1,8 @@
 """Tests for basic_open_agent_tools.data.json_tools module."""
 
+import enum
 import json
+import uuid
 
 import pytest
 
@@ -12,6 +14,42 @@ from basic_open_agent_tools.data.json_tools import (
 from basic_open_agent_tools.exceptions import SerializationError
 
 
+class _Color(enum.Enum):
+    RED = "red"
+
+
+# Case tables built once at import and shared across parametrized tests
+_VALID_JSON_OBJECTS = (
+    "{}",
+    '{"key": "value"}',
+    '{"a": 1, "b": 2}',
+    '{"nested": {"key": "value"}}',
+    '{"array": [1, 2, 3]}',
+    '{"mixed": {"num": 42, "arr": [1, 2], "bool": true}}',
+)
+
+# Malformed input rejected by every JSON backend
+_INVALID_JSON_CASES = (
+    '{"invalid": }',  # Missing value
+    '{"unclosed": "string}',  # Unclosed string
+    '{invalid: "no quotes"}',  # Unquoted key
+    '{"trailing": "comma",}',  # Trailing comma
+    "{",  # Incomplete object
+    "[",  # Incomplete array
+    '{"a": 1, "b":}',  # Missing value
+    "",  # Empty string
+    "not json at all",  # Plain text
+    '{"bad_escape": "\\u"}',  # Incomplete Unicode escape
+    '{"bad_escape": "\\uGGGG"}',  # Invalid Unicode escape
+    "undefined",  # JavaScript undefined (not JSON)
+    "{a: 1}",  # Unquoted key
+    "{'single': 'quotes'}",  # Single quotes
+)
+
+_LONG_STRING_JSON = '"' + "a" * 10000 + '"'
+_LARGE_NESTED_ARRAY = "[" + ",".join(map(str, range(1000))) + "]"
+
+
 class TestSafeJsonSerialize:
     """Test cases for safe_json_serialize function."""
 
@@ -113,6 +151,54 @@ class TestSafeJsonSerialize:
         assert parsed == data
         assert len(parsed["items"]) == 100
 
+    def test_indent_two_matches_stdlib_format(self) -> None:
+        """Test that 2-space output is byte-identical to stdlib json."""
+        data = {
+            "user": {"name": "John", "scores": [95, 87, 92]},
+            "empty_list": [],
+            "empty_dict": {},
+            "unicode": "Hello 世界",
+            "null_value": None,
+        }
+
+        result = safe_json_serialize(data, 2)
+        assert result == json.dumps(data, indent=2, ensure_ascii=False)
+
+    def test_indent_two_non_string_keys(self) -> None:
+        """Test that non-string keys still serialize with 2-space indent."""
+        data = {1: "one", 2: "two"}
+
+        result = safe_json_serialize(data, 2)
+        assert json.loads(result) == {"1": "one", "2": "two"}
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param({"value": float("nan")}, id="nan"),
+            pytest.param({"value": float("inf")}, id="infinity"),
+            pytest.param({"value": 1e16}, id="float-exponent"),
+            pytest.param({"value": 2**70}, id="big-int"),
+        ],
+    )
+    def test_indent_two_keeps_stdlib_literals(self, data: dict) -> None:
+        """Test that 2-space output keeps stdlib NaN and float spellings."""
+        result = safe_json_serialize(data, 2)
+        assert result == json.dumps(data, indent=2, ensure_ascii=False)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(uuid.UUID(int=0), id="uuid"),
+            pytest.param(_Color.RED, id="enum"),
+        ],
+    )
+    def test_indent_two_rejects_non_json_types(self, value: object) -> None:
+        """Test that types stdlib json rejects still raise SerializationError."""
+        with pytest.raises(
+            SerializationError, match="Failed to serialize data to JSON"
+        ):
+            safe_json_serialize({"value": value}, 2)
+
     def test_invalid_indent_type(self) -> None:
         """Test error handling for invalid indent type."""
         data = {"test": "value"}
@@ -304,25 +390,13 @@ class TestSafeJsonDeserialize:
         with pytest.raises(TypeError, match="Input must be a string"):
             safe_json_deserialize(None)  # type: ignore[arg-type]
 
-    def test_invalid_json_string(self) -> None:
+    @pytest.mark.parametrize("invalid_json", _INVALID_JSON_CASES)
+    def test_invalid_json_string(self, invalid_json: str) -> None:
         """Test error handling for invalid JSON strings."""
-        invalid_json_cases = [
-            '{"invalid": }',  # Missing value
-            '{"unclosed": "string}',  # Unclosed string
-            '{invalid: "no quotes"}',  # Unquoted key
-            '{"trailing": "comma",}',  # Trailing comma
-            "{",  # Incomplete object
-            "[",  # Incomplete array
-            '{"a": 1, "b":}',  # Missing value
-            "",  # Empty string
-            "not json at all",  # Plain text
-        ]
-
-        for invalid_json in invalid_json_cases:
-            with pytest.raises(
-                SerializationError, match="Failed to deserialize JSON string"
-            ):
-                safe_json_deserialize(invalid_json)
+        with pytest.raises(
+            SerializationError, match="Failed to deserialize JSON string"
+        ):
+            safe_json_deserialize(invalid_json)
 
     def test_duplicate_keys_handling(self) -> None:
         """Test handling of duplicate keys in JSON (valid but worth testing)."""
@@ -345,113 +419,97 @@ class TestSafeJsonDeserialize:
             ):
                 safe_json_deserialize(invalid_case)
 
+    @pytest.mark.parametrize(
+        "json_str",
+        [
+            pytest.param('{"value": NaN}', id="nan"),
+            pytest.param('{"value": 123456789012345678901234567890}', id="big-int"),
+            pytest.param('{"value": -9223372036854775809}', id="below-int64"),
+            pytest.param('{"value": 18446744073709551616}', id="above-uint64"),
+            pytest.param('{"value": "\\ud800"}', id="lone-surrogate"),
+            pytest.param('{"value": 1e16, "list": [1.5, -0.0]}', id="floats"),
+        ],
+    )
+    def test_orjson_backend_matches_stdlib(self, json_str: str) -> None:
+        """Test that parsing with orjson installed matches stdlib json."""
+        pytest.importorskip("orjson")
+        result = safe_json_deserialize(json_str)
+        # repr comparison so NaN and -0.0 are checked too
+        assert repr(result) == repr(json.loads(json_str))
+
 
 class TestValidateJsonString:
     """Test cases for validate_json_string function."""
 
-    def test_valid_json_objects(self) -> None:
+    @pytest.mark.parametrize("valid_json", _VALID_JSON_OBJECTS)
+    def test_valid_json_objects(self, valid_json: str) -> None:
         """Test validation of valid JSON objects."""
-        valid_cases = [
-            "{}",
-            '{"key": "value"}',
-            '{"a": 1, "b": 2}',
-            '{"nested": {"key": "value"}}',
-            '{"array": [1, 2, 3]}',
-            '{"mixed": {"num": 42, "arr": [1, 2], "bool": true}}',
-        ]
+        assert validate_json_string(valid_json) is True
 
-        for valid_json in valid_cases:
-            assert validate_json_string(valid_json) is True
-
-    def test_valid_json_arrays(self) -> None:
-        """Test validation of valid JSON arrays."""
-        valid_cases = [
+    @pytest.mark.parametrize(
+        "valid_json",
+        [
             "[]",
             "[1, 2, 3]",
             '["a", "b", "c"]',
             '[{"key": "value"}]',
             '[1, "two", true, null]',
             "[[1, 2], [3, 4]]",
-        ]
-
-        for valid_json in valid_cases:
-            assert validate_json_string(valid_json) is True
+        ],
+    )
+    def test_valid_json_arrays(self, valid_json: str) -> None:
+        """Test validation of valid JSON arrays."""
+        assert validate_json_string(valid_json) is True
 
-    def test_valid_json_primitives(self) -> None:
+    @pytest.mark.parametrize(
+        "valid_json", ['"string"', "42", "3.14159", "true", "false", "null"]
+    )
+    def test_valid_json_primitives(self, valid_json: str) -> None:
         """Test validation of valid JSON primitive values."""
-        valid_cases = [
-            '"string"',
-            "42",
-            "3.14159",
-            "true",
-            "false",
-            "null",
-        ]
+        assert validate_json_string(valid_json) is True
 
-        for valid_json in valid_cases:
-            assert validate_json_string(valid_json) is True
-
-    def test_valid_json_with_unicode(self) -> None:
-        """Test validation of JSON with Unicode characters."""
-        valid_cases = [
+    @pytest.mark.parametrize(
+        "valid_json",
+        [
             '{"text": "Hello 世界"}',
             '{"emoji": "🎉🚀"}',
             '{"special": "café naïve résumé"}',
             '["unicode", "世界", "🚀"]',
-        ]
-
-        for valid_json in valid_cases:
-            assert validate_json_string(valid_json) is True
+        ],
+    )
+    def test_valid_json_with_unicode(self, valid_json: str) -> None:
+        """Test validation of JSON with Unicode characters."""
+        assert validate_json_string(valid_json) is True
 
-    def test_valid_json_formatting_variations(self) -> None:
-        """Test validation of various JSON formatting styles."""
-        valid_cases = [
+    @pytest.mark.parametrize(
+        "valid_json",
+        [
             '{"a":1,"b":2}',  # Compact
             '{ "a" : 1 , "b" : 2 }',  # Spaced
             '{\n  "a": 1,\n  "b": 2\n}',  # Multiline
             '{"a": 1, "b": 2}',  # Standard
-        ]
-
-        for valid_json in valid_cases:
-            assert validate_json_string(valid_json) is True
+        ],
+    )
+    def test_valid_json_formatting_variations(self, valid_json: str) -> None:
+        """Test validation of various JSON formatting styles."""
+        assert validate_json_string(valid_json) is True
 
-    def test_invalid_json_strings(self) -> None:
+    @pytest.mark.parametrize("invalid_json", _INVALID_JSON_CASES)
+    def test_invalid_json_strings(self, invalid_json: str) -> None:
         """Test validation of invalid JSON strings."""
-        invalid_cases = [
-            '{"invalid": }',  # Missing value
-            '{"unclosed": "string}',  # Unclosed string
-            '{invalid: "no quotes"}',  # Unquoted key
-            '{"trailing": "comma",}',  # Trailing comma
-            "{",  # Incomplete object
-            "[",  # Incomplete array
-            '{"a": 1, "b":}',  # Missing value
-            "",  # Empty string
-            "not json at all",  # Plain text
-            '{"bad_escape": "\\u"}',  # Incomplete Unicode escape
-            '{"bad_escape": "\\uGGGG"}',  # Invalid Unicode escape
-            "undefined",  # JavaScript undefined (not JSON)
-            "{a: 1}",  # Unquoted key
-            "{'single': 'quotes'}",  # Single quotes
-        ]
-
-        for invalid_json in invalid_cases:
-            assert validate_json_string(invalid_json) is False
+        assert validate_json_string(invalid_json) is False
 
-    def test_non_string_input(self) -> None:
+    @pytest.mark.parametrize(
+        "non_string", [42, 3.14, True, False, None, [], {}, {"key": "value"}]
+    )
+    def test_non_string_input(self, non_string: object) -> None:
         """Test validation behavior with non-string input."""
-        non_string_cases = [
-            42,
-            3.14,
-            True,
-            False,
-            None,
-            [],
-            {},
-            {"key": "value"},
-        ]
+        assert validate_json_string(non_string) is False  # type: ignore[arg-type]
 
-        for non_string in non_string_cases:
-            assert validate_json_string(non_string) is False  # type: ignore[arg-type]
+    @pytest.mark.parametrize("json_str", ["NaN", "Infinity", '{"value": -Infinity}'])
+    def test_stdlib_extensions_remain_valid(self, json_str: str) -> None:
+        """Test that constants accepted by stdlib json stay valid with orjson."""
+        assert validate_json_string(json_str) is True
 
     def test_edge_cases(self) -> None:
         """Test validation of edge cases."""
@@ -459,16 +517,14 @@ class TestValidateJsonString:
         assert validate_json_string("999999999999999999999999999999999") is True
 
         # Very long strings
-        long_string = '"' + "a" * 10000 + '"'
-        assert validate_json_string(long_string) is True
+        assert validate_json_string(_LONG_STRING_JSON) is True
 
         # Deeply nested structures
         nested = '{"a": {"b": {"c": {"d": "value"}}}}'
         assert validate_json_string(nested) is True
 
         # Large arrays
-        large_array = "[" + ",".join(str(i) for i in range(1000)) + "]"
-        assert validate_json_string(large_array) is True
+        assert validate_json_string(_LARGE_NESTED_ARRAY) is True
 
 
 # Integration tests
@@ -499,18 +555,26 @@ class TestJsonToolsIntegration:
         # Compare
         assert result_data == original_data
 
-    def test_validation_with_serialized_data(self) -> None:
-        """Test that serialized data always passes validation."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "data",
+        [
             {},
             {"simple": "value"},
             {"complex": {"nested": [1, 2, {"deep": True}]}},
             {"unicode": "世界 🚀 café"},
-        ]
+            {"numbers": [0, -1, 2**53, 1.5e-10, -0.0]},
+            {"escapes": 'quote " backslash \\ newline \n tab \t'},
+            {"empty": {"list": [], "dict": {}, "string": ""}, "null": None},
+        ],
+    )
+    @pytest.mark.parametrize("indent", [0, 2, 4])
+    def test_validation_with_serialized_data(self, data: dict, indent: int) -> None:
+        """Test that serialized data always validates and roundtrips."""
+        json_str = safe_json_serialize(data, indent)
+        assert validate_json_string(json_str) is True
 
-        for data in test_cases:
-            json_str = safe_json_serialize(data, 2)
-            assert validate_json_string(json_str) is True
+        result_data = safe_json_deserialize(json_str)
+        assert result_data == data
 
     def test_error_consistency(self) -> None:
         """Test that invalid JSON fails consistently across functions."""
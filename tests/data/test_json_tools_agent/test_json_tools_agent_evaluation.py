@@ -4,8 +4,6 @@ This test suite validates that JSON tools functions work correctly
 when called by AI agents in the Google ADK framework.
 """
 
-import asyncio
-
 import pytest
 from google.adk.evaluation.agent_evaluator import AgentEvaluator
 
@@ -15,10 +13,12 @@ class TestJsonToolsAgentEvaluation:
 
     @pytest.mark.agent_evaluation
     @pytest.mark.asyncio
-    async def test_list_available_tools_agent(self, agent_evaluation_sequential):
+    async def test_list_available_tools_agent(
+        self, agent_evaluation_sequential, agent_rate_limiter
+    ):
         """Test agent listing available tools."""
-        await AgentEvaluator.evaluate(
-            agent_module="tests.data.test_json_tools_agent.agent",
-            eval_dataset_file_path_or_dir="tests/data/test_json_tools_agent/list_available_tools.test.json",
-        )
-        await asyncio.sleep(2)  # Rate limiting delay
+        async with agent_rate_limiter:
+            await AgentEvaluator.evaluate(
+                agent_module="tests.data.test_json_tools_agent.agent",
+                eval_dataset_file_path_or_dir="tests/data/test_json_tools_agent/list_available_tools.test.json",
+            )
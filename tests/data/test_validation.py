@@ -1,5 +1,9 @@
 """Tests for basic_open_agent_tools.data.validation module."""
 
+import json
+from types import MappingProxyType
+from typing import Any
+
 import pytest
 
 from basic_open_agent_tools.data.validation import (
@@ -7,6 +11,7 @@ from basic_open_agent_tools.data.validation import (
     check_required_fields_simple,
     create_validation_report,
     create_validation_report_simple,
+    validate_batch,
     validate_data_types_simple,
     validate_range_simple,
     validate_schema_simple,
@@ -83,22 +88,26 @@ class TestValidateSchemaSimple:
 
     def test_invalid_schema_type_error(self) -> None:
         """Test error handling for invalid schema type."""
-        with pytest.raises(TypeError, match="schema_definition must be a dictionary"):
+        with pytest.raises(TypeError) as exc_info:
             validate_schema_simple({"data": "value"}, "invalid_schema")  # type: ignore[arg-type]
+        assert "schema_definition must be a dictionary" in str(exc_info.value)
 
-        with pytest.raises(TypeError, match="schema_definition must be a dictionary"):
+        with pytest.raises(TypeError) as exc_info:
             validate_schema_simple({"data": "value"}, ["not", "dict"])  # type: ignore[arg-type]
+        assert "schema_definition must be a dictionary" in str(exc_info.value)
 
     def test_data_type_mismatch(self) -> None:
         """Test validation failure when data type doesn't match schema."""
         schema = {"type": "object"}
 
         # Non-dict data should fail for object schema
-        with pytest.raises(ValidationError, match="Expected object, got"):
+        with pytest.raises(ValidationError) as exc_info:
             validate_schema_simple(["not", "a", "dict"], schema)  # type: ignore[arg-type]
+        assert "Expected object, got" in str(exc_info.value)
 
-        with pytest.raises(ValidationError, match="Expected object, got"):
+        with pytest.raises(ValidationError) as exc_info:
             validate_schema_simple("string", schema)  # type: ignore[arg-type]
+        assert "Expected object, got" in str(exc_info.value)
 
     def test_missing_required_fields(self) -> None:
         """Test validation failure for missing required fields."""
@@ -112,24 +121,23 @@ class TestValidateSchemaSimple:
         }
 
         # Missing email field
-        with pytest.raises(
-            ValidationError, match="Required property 'email' is missing"
-        ):
+        with pytest.raises(ValidationError) as exc_info:
             validate_schema_simple({"name": "Alice"}, schema)
+        assert str(exc_info.value) == "Required property 'email' is missing"
 
         # Missing both fields
-        with pytest.raises(
-            ValidationError, match="Required property 'name' is missing"
-        ):
+        with pytest.raises(ValidationError) as exc_info:
             validate_schema_simple({}, schema)
+        assert str(exc_info.value) == "Required property 'name' is missing"
 
     def test_array_schema_not_supported(self) -> None:
         """Test that array schemas are not supported."""
         schema = {"type": "array"}
         data = {"key": "value"}
 
-        with pytest.raises(ValidationError, match="Array validation not supported"):
+        with pytest.raises(ValidationError) as exc_info:
             validate_schema_simple(data, schema)
+        assert "Array validation not supported" in str(exc_info.value)
 
     def test_empty_schema(self) -> None:
         """Test validation with empty schema."""
@@ -160,6 +168,57 @@ class TestValidateSchemaSimple:
         result = validate_schema_simple(data, schema)
         assert result is True
 
+    def test_schema_mutation_after_validation(self) -> None:
+        """Test that a reused schema dict is re-read after being modified."""
+        schema = {"type": "object", "required": ["name"]}
+        assert validate_schema_simple({"name": "Alice"}, schema) is True
+
+        schema["required"] = ["name", "email"]
+        with pytest.raises(ValidationError) as exc_info:
+            validate_schema_simple({"name": "Alice"}, schema)
+        assert str(exc_info.value) == "Required property 'email' is missing"
+
+    def test_nested_array_schema_not_supported(self) -> None:
+        """Test that nested array schemas are rejected for dict values."""
+        schema = {
+            "type": "object",
+            "properties": {"items": {"type": "array"}},
+        }
+
+        assert validate_schema_simple({"items": [1, 2]}, schema) is True
+        with pytest.raises(ValidationError) as exc_info:
+            validate_schema_simple({"items": {"0": 1}}, schema)
+        assert "Array validation not supported" in str(exc_info.value)
+
+    def test_non_json_schema_values(self) -> None:
+        """Test schemas holding values that can't be serialized to JSON."""
+        schema = {"type": "object", "required": ("name",), "default": object()}
+
+        assert validate_schema_simple({"name": "Alice"}, schema) is True
+        with pytest.raises(ValidationError) as exc_info:
+            validate_schema_simple({}, schema)
+        assert "Required property 'name'" in str(exc_info.value)
+
+    def test_non_string_property_keys(self) -> None:
+        """Test that int property keys still validate their nested values."""
+        schema = {
+            "type": "object",
+            "properties": {1: {"type": "object", "required": ["x"]}},
+        }
+
+        assert validate_schema_simple({1: {"x": 0}}, schema) is True
+        with pytest.raises(ValidationError) as exc_info:
+            validate_schema_simple({1: {}}, schema)
+        assert str(exc_info.value) == "Required property 'x' is missing"
+
+    def test_tuple_required_entries(self) -> None:
+        """Test that tuple entries in required are matched as tuple keys."""
+        schema = {"type": "object", "required": [("a", "b")]}
+
+        assert validate_schema_simple({("a", "b"): 1}, schema) is True
+        with pytest.raises(ValidationError):
+            validate_schema_simple({}, schema)
+
 
 class TestCheckRequiredFields:
     """Test cases for check_required_fields function."""
@@ -193,57 +252,73 @@ class TestCheckRequiredFields:
         data = {"name": "Alice"}
         required = ["name", "age"]
 
-        with pytest.raises(
-            ValidationError, match="Required fields are missing: \\['age'\\]"
-        ):
+        with pytest.raises(ValidationError) as exc_info:
             check_required_fields(data, required)
+        assert str(exc_info.value) == "Required fields are missing: ['age']"
 
     def test_multiple_missing_fields(self) -> None:
         """Test when multiple required fields are missing."""
         data = {"name": "Alice"}
         required = ["name", "age", "email", "phone"]
 
-        with pytest.raises(
-            ValidationError,
-            match="Required fields are missing: \\['age', 'email', 'phone'\\]",
-        ):
+        with pytest.raises(ValidationError) as exc_info:
             check_required_fields(data, required)
+        assert (
+            str(exc_info.value)
+            == "Required fields are missing: ['age', 'email', 'phone']"
+        )
 
     def test_all_fields_missing(self) -> None:
         """Test when all required fields are missing."""
         data = {"other": "value"}
         required = ["name", "age"]
 
-        with pytest.raises(
-            ValidationError, match="Required fields are missing: \\['name', 'age'\\]"
-        ):
+        with pytest.raises(ValidationError) as exc_info:
+            check_required_fields(data, required)
+        assert str(exc_info.value) == "Required fields are missing: ['name', 'age']"
+
+    def test_missing_fields_keep_required_order_on_wide_data(self) -> None:
+        """Test missing fields are reported in required order for wide records."""
+        data = {f"field_{i}": i for i in range(10000)}
+        required = [f"field_{i}" for i in range(9999, -1, -1)]
+        required[10:10] = ["zeta", "alpha"]
+
+        with pytest.raises(ValidationError) as exc_info:
             check_required_fields(data, required)
 
+        assert str(exc_info.value) == "Required fields are missing: ['zeta', 'alpha']"
+
     def test_invalid_data_type(self) -> None:
         """Test error handling for invalid data type."""
         required = ["name"]
 
-        with pytest.raises(TypeError, match="data must be a dictionary"):
+        with pytest.raises(TypeError) as exc_info:
             check_required_fields(["not", "dict"], required)  # type: ignore[arg-type]
+        assert "data must be a dictionary" in str(exc_info.value)
 
-        with pytest.raises(TypeError, match="data must be a dictionary"):
+        with pytest.raises(TypeError) as exc_info:
             check_required_fields("string", required)  # type: ignore[arg-type]
+        assert "data must be a dictionary" in str(exc_info.value)
 
-        with pytest.raises(TypeError, match="data must be a dictionary"):
+        with pytest.raises(TypeError) as exc_info:
             check_required_fields(None, required)  # type: ignore[arg-type]
+        assert "data must be a dictionary" in str(exc_info.value)
 
     def test_invalid_required_type(self) -> None:
         """Test error handling for invalid required type."""
         data = {"name": "Alice"}
 
-        with pytest.raises(TypeError, match="required must be a list"):
+        with pytest.raises(TypeError) as exc_info:
             check_required_fields(data, {"not": "list"})  # type: ignore[arg-type]
+        assert "required must be a list" in str(exc_info.value)
 
-        with pytest.raises(TypeError, match="required must be a list"):
+        with pytest.raises(TypeError) as exc_info:
             check_required_fields(data, "string")  # type: ignore[arg-type]
+        assert "required must be a list" in str(exc_info.value)
 
-        with pytest.raises(TypeError, match="required must be a list"):
+        with pytest.raises(TypeError) as exc_info:
             check_required_fields(data, None)  # type: ignore[arg-type]
+        assert "required must be a list" in str(exc_info.value)
 
     def test_field_values_with_various_types(self) -> None:
         """Test that field values can be any type."""
@@ -316,11 +391,12 @@ class TestValidateDataTypesSimple:
         data = {"name": "Alice", "age": "30"}  # age is string, not int
         type_map = {"name": "str", "age": "int"}
 
-        with pytest.raises(
-            ValidationError,
-            match="Type validation errors: Field 'age': expected int, got str",
-        ):
+        with pytest.raises(ValidationError) as exc_info:
             validate_data_types_simple(data, type_map)
+        assert (
+            str(exc_info.value)
+            == "Type validation errors: Field 'age': expected int, got str"
+        )
 
     def test_multiple_type_mismatches(self) -> None:
         """Test when multiple field types don't match."""
@@ -335,6 +411,23 @@ class TestValidateDataTypesSimple:
         assert "Field 'age': expected int, got str" in error_msg
         assert "Field 'active': expected bool, got str" in error_msg
 
+    def test_none_value_is_type_checked(self) -> None:
+        """Test that a field present with a None value is still type checked."""
+        data = {"name": None}
+        type_map = {"name": "str", "missing_field": "str"}
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_data_types_simple(data, type_map)
+        assert (
+            str(exc_info.value)
+            == "Type validation errors: Field 'name': expected str, got NoneType"
+        )
+
+        report = create_validation_report(data, {"types": type_map})
+        assert report["errors"] == [
+            "Type validation errors: Field 'name': expected str, got NoneType"
+        ]
+
     def test_invalid_type_name(self) -> None:
         """Test behavior with invalid type name in type_map."""
         data = {"field": "value"}
@@ -353,25 +446,50 @@ class TestValidateDataTypesSimple:
         result = validate_data_types_simple(data, type_map)
         assert result is True
 
+    def test_bool_is_not_numeric(self) -> None:
+        """Test that booleans don't satisfy int or float types."""
+        data = {"count": True, "ratio": False, "flag": True}
+        type_map = {"count": "int", "ratio": "float", "flag": "bool"}
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_data_types_simple(data, type_map)
+
+        error_msg = str(exc_info.value)
+        assert "Field 'count': expected int, got bool" in error_msg
+        assert "Field 'ratio': expected float, got bool" in error_msg
+        assert "'flag'" not in error_msg
+
+    def test_int_accepted_as_float(self) -> None:
+        """Test that integers satisfy float while floats don't satisfy int."""
+        assert validate_data_types_simple({"score": 85}, {"score": "float"}) is True
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_data_types_simple({"count": 1.5}, {"count": "int"})
+        assert "expected int, got float" in str(exc_info.value)
+
     def test_invalid_data_type(self) -> None:
         """Test error handling for invalid data type."""
         type_map = {"field": "str"}
 
-        with pytest.raises(TypeError, match="data must be a dictionary"):
+        with pytest.raises(TypeError) as exc_info:
             validate_data_types_simple(["not", "dict"], type_map)  # type: ignore[arg-type]
+        assert "data must be a dictionary" in str(exc_info.value)
 
-        with pytest.raises(TypeError, match="data must be a dictionary"):
+        with pytest.raises(TypeError) as exc_info:
             validate_data_types_simple("string", type_map)  # type: ignore[arg-type]
+        assert "data must be a dictionary" in str(exc_info.value)
 
     def test_invalid_type_map_type(self) -> None:
         """Test error handling for invalid type_map type."""
         data = {"field": "value"}
 
-        with pytest.raises(TypeError, match="type_map must be a dictionary"):
+        with pytest.raises(TypeError) as exc_info:
             validate_data_types_simple(data, ["not", "dict"])  # type: ignore[arg-type]
+        assert "type_map must be a dictionary" in str(exc_info.value)
 
-        with pytest.raises(TypeError, match="type_map must be a dictionary"):
+        with pytest.raises(TypeError) as exc_info:
             validate_data_types_simple(data, "string")  # type: ignore[arg-type]
+        assert "type_map must be a dictionary" in str(exc_info.value)
 
     def test_supported_type_names(self) -> None:
         """Test all supported type names."""
@@ -396,96 +514,113 @@ class TestValidateDataTypesSimple:
         assert result is True
 
 
+IN_RANGE_CASES = [
+    pytest.param(5.0, 1.0, 10.0, id="float"),
+    pytest.param(1.0, 1.0, 10.0, id="float-min-boundary"),
+    pytest.param(10.0, 1.0, 10.0, id="float-max-boundary"),
+    pytest.param(5.5, 1.0, 10.0, id="float-fraction"),
+    pytest.param(5, 1, 10, id="int"),
+    pytest.param(1, 1, 10, id="int-min-boundary"),
+    pytest.param(10, 1, 10, id="int-max-boundary"),
+    pytest.param(5, 1.0, 10.0, id="int-in-float-range"),
+    pytest.param(5.0, 1, 10, id="float-in-int-range"),
+    pytest.param(5.5, 1, 10.0, id="mixed-bounds"),
+    pytest.param(-5.0, -10.0, -1.0, id="negative-range"),
+    pytest.param(0.0, -10.0, 10.0, id="zero-in-signed-range"),
+    pytest.param(-1.0, -10.0, 10.0, id="negative-in-signed-range"),
+    pytest.param(5.0, 5.0, 5.0, id="equal-min-max"),
+    pytest.param(1e10, 0, 2e10, id="very-large"),
+    pytest.param(1e-10, 0, 1e-5, id="very-small"),
+]
+
+OUT_OF_RANGE_CASES = [
+    pytest.param(0.5, 1.0, 10.0, "Value 0.5 is below minimum 1.0", id="below-float"),
+    pytest.param(-5, 0, 10, "Value -5 is below minimum 0", id="below-int"),
+    pytest.param(15.0, 1.0, 10.0, "Value 15.0 is above maximum 10.0", id="above-float"),
+    pytest.param(100, 1, 50, "Value 100 is above maximum 50", id="above-int"),
+    pytest.param(
+        4.0, 5.0, 5.0, "Value 4.0 is below minimum 5.0", id="below-equal-min-max"
+    ),
+    pytest.param(
+        6.0, 5.0, 5.0, "Value 6.0 is above maximum 5.0", id="above-equal-min-max"
+    ),
+]
+
+NON_NUMERIC_RANGE_CASES = [
+    pytest.param("5", 1.0, 10.0, "value must be numeric", id="value-str"),
+    pytest.param(None, 1.0, 10.0, "value must be numeric", id="value-none"),
+    pytest.param([5], 1.0, 10.0, "value must be numeric", id="value-list"),
+    pytest.param(5.0, "1", 10.0, "min_val must be numeric", id="min-str"),
+    pytest.param(5.0, None, 10.0, "min_val must be numeric", id="min-none"),
+    pytest.param(5.0, 1.0, "10", "max_val must be numeric", id="max-str"),
+    pytest.param(5.0, 1.0, None, "max_val must be numeric", id="max-none"),
+]
+
+
 class TestValidateRangeSimple:
     """Test cases for validate_range_simple function."""
 
-    def test_value_within_range(self) -> None:
+    @pytest.mark.parametrize("value,min_val,max_val", IN_RANGE_CASES)
+    def test_value_within_range(
+        self, value: float, min_val: float, max_val: float
+    ) -> None:
         """Test when value is within the specified range."""
-        assert validate_range_simple(5.0, 1.0, 10.0) is True
-        assert validate_range_simple(1.0, 1.0, 10.0) is True  # Boundary: min
-        assert validate_range_simple(10.0, 1.0, 10.0) is True  # Boundary: max
-        assert validate_range_simple(5.5, 1.0, 10.0) is True  # Float
-
-    def test_integer_values(self) -> None:
-        """Test range validation with integer values."""
-        assert validate_range_simple(5, 1, 10) is True
-        assert validate_range_simple(1, 1, 10) is True
-        assert validate_range_simple(10, 1, 10) is True
-
-    def test_mixed_int_float_values(self) -> None:
-        """Test range validation with mixed int/float values."""
-        assert validate_range_simple(5, 1.0, 10.0) is True
-        assert validate_range_simple(5.0, 1, 10) is True
-        assert validate_range_simple(5.5, 1, 10.0) is True
-
-    def test_negative_ranges(self) -> None:
-        """Test range validation with negative values."""
-        assert validate_range_simple(-5.0, -10.0, -1.0) is True
-        assert validate_range_simple(0.0, -10.0, 10.0) is True
-        assert validate_range_simple(-1.0, -10.0, 10.0) is True
+        assert validate_range_simple(value, min_val, max_val) is True
 
-    def test_value_below_minimum(self) -> None:
-        """Test when value is below minimum."""
-        with pytest.raises(ValidationError, match="Value 0.5 is below minimum 1.0"):
-            validate_range_simple(0.5, 1.0, 10.0)
-
-        with pytest.raises(ValidationError, match="Value -5 is below minimum 0"):
-            validate_range_simple(-5, 0, 10)
-
-    def test_value_above_maximum(self) -> None:
-        """Test when value is above maximum."""
-        with pytest.raises(ValidationError, match="Value 15.0 is above maximum 10.0"):
-            validate_range_simple(15.0, 1.0, 10.0)
-
-        with pytest.raises(ValidationError, match="Value 100 is above maximum 50"):
-            validate_range_simple(100, 1, 50)
-
-    def test_invalid_value_type(self) -> None:
-        """Test error handling for invalid value type."""
-        with pytest.raises(TypeError, match="value must be numeric"):
-            validate_range_simple("5", 1.0, 10.0)  # type: ignore[arg-type]
-
-        with pytest.raises(TypeError, match="value must be numeric"):
-            validate_range_simple(None, 1.0, 10.0)  # type: ignore[arg-type]
-
-        with pytest.raises(TypeError, match="value must be numeric"):
-            validate_range_simple([5], 1.0, 10.0)  # type: ignore[arg-type]
-
-    def test_invalid_min_val_type(self) -> None:
-        """Test error handling for invalid min_val type."""
-        with pytest.raises(TypeError, match="min_val must be numeric"):
-            validate_range_simple(5.0, "1", 10.0)  # type: ignore[arg-type]
-
-        with pytest.raises(TypeError, match="min_val must be numeric"):
-            validate_range_simple(5.0, None, 10.0)  # type: ignore[arg-type]
-
-    def test_invalid_max_val_type(self) -> None:
-        """Test error handling for invalid max_val type."""
-        with pytest.raises(TypeError, match="max_val must be numeric"):
-            validate_range_simple(5.0, 1.0, "10")  # type: ignore[arg-type]
-
-        with pytest.raises(TypeError, match="max_val must be numeric"):
-            validate_range_simple(5.0, 1.0, None)  # type: ignore[arg-type]
-
-    def test_edge_case_equal_min_max(self) -> None:
-        """Test when min and max are equal."""
-        assert validate_range_simple(5.0, 5.0, 5.0) is True
-
-        with pytest.raises(ValidationError, match="Value 4.0 is below minimum 5.0"):
-            validate_range_simple(4.0, 5.0, 5.0)
-
-        with pytest.raises(ValidationError, match="Value 6.0 is above maximum 5.0"):
-            validate_range_simple(6.0, 5.0, 5.0)
-
-    def test_very_large_numbers(self) -> None:
-        """Test with very large numbers."""
-        large_num = 1e10
-        assert validate_range_simple(large_num, 0, 2e10) is True
-
-    def test_very_small_numbers(self) -> None:
-        """Test with very small numbers."""
-        small_num = 1e-10
-        assert validate_range_simple(small_num, 0, 1e-5) is True
+    @pytest.mark.parametrize("value,min_val,max_val,message", OUT_OF_RANGE_CASES)
+    def test_value_out_of_range(
+        self, value: float, min_val: float, max_val: float, message: str
+    ) -> None:
+        """Test when value is below the minimum or above the maximum."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_range_simple(value, min_val, max_val)
+        assert str(exc_info.value) == message
+
+    @pytest.mark.parametrize("value,min_val,max_val,message", NON_NUMERIC_RANGE_CASES)
+    def test_non_numeric_arguments(
+        self, value: Any, min_val: Any, max_val: Any, message: str
+    ) -> None:
+        """Test error handling for non-numeric value, min_val or max_val."""
+        with pytest.raises(TypeError) as exc_info:
+            validate_range_simple(value, min_val, max_val)
+        assert str(exc_info.value) == message
+
+
+EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+PHONE_PATTERN = r"^\d{3}-\d{3}-\d{4}$"
+
+
+# Module-scoped fixtures below are shared between tests; don't mutate them.
+@pytest.fixture(scope="module")
+def contact_patterns() -> dict[str, str]:
+    """Email and phone patterns used by the pattern rule tests."""
+    return {"email": EMAIL_PATTERN, "phone": PHONE_PATTERN}
+
+
+@pytest.fixture(scope="module")
+def contact_rules(contact_patterns: dict[str, str]) -> dict[str, Any]:
+    """Rules combining every rule type for a user contact record."""
+    return {
+        "required": ["name", "age", "email"],
+        "types": {"name": "str", "age": "int", "email": "str", "score": "float"},
+        "ranges": {"age": {"min": 18, "max": 65}, "score": {"min": 0, "max": 100}},
+        "patterns": contact_patterns,
+        "allowed_fields": ["name", "age", "email", "score", "phone"],
+    }
+
+
+@pytest.fixture(scope="module")
+def user_schema() -> dict[str, Any]:
+    """Object schema for a user with required name, age and email."""
+    return {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "age": {"type": "number"},
+            "email": {"type": "string"},
+        },
+        "required": ["name", "age", "email"],
+    }
 
 
 class TestCreateValidationReport:
@@ -576,30 +711,32 @@ class TestCreateValidationReport:
             "rating" in error and "below minimum" in error for error in result["errors"]
         )
 
-    def test_pattern_validation_success(self) -> None:
+    def test_range_validation_partial_bounds(self) -> None:
+        """Test that a range missing a bound is reported, not raised."""
+        data = {"score": 50, "rating": 3}
+        rules = {"ranges": {"score": {"min": 0}, "rating": {"max": 5}}}
+
+        result = create_validation_report(data, rules)
+
+        assert result["errors"] == [
+            "Range validation failed for 'score': max_val must be numeric",
+            "Range validation failed for 'rating': min_val must be numeric",
+        ]
+
+    def test_pattern_validation_success(self, contact_patterns: dict[str, str]) -> None:
         """Test validation report with successful pattern validation."""
         data = {"email": "alice@example.com", "phone": "123-456-7890"}
-        rules = {
-            "patterns": {
-                "email": r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
-                "phone": r"^\d{3}-\d{3}-\d{4}$",
-            },
-        }
+        rules = {"patterns": contact_patterns}
 
         result = create_validation_report(data, rules)
 
         assert result["valid"] is True
         assert result["errors"] == []
 
-    def test_pattern_validation_failure(self) -> None:
+    def test_pattern_validation_failure(self, contact_patterns: dict[str, str]) -> None:
         """Test validation report with pattern validation failures."""
         data = {"email": "invalid-email", "phone": "123456"}
-        rules = {
-            "patterns": {
-                "email": r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
-                "phone": r"^\d{3}-\d{3}-\d{4}$",
-            },
-        }
+        rules = {"patterns": contact_patterns}
 
         result = create_validation_report(data, rules)
 
@@ -630,6 +767,38 @@ class TestCreateValidationReport:
         assert len(result["warnings"]) == 1
         assert "Invalid regex pattern" in result["warnings"][0]
 
+    def test_repeated_patterns_across_reports(self) -> None:
+        """Test that reused patterns give the same results on every call."""
+        rules = {"patterns": {"code": r"^[A-Z]{3}$", "bad": "[invalid_regex"}}
+
+        for _ in range(3):
+            valid = create_validation_report({"code": "ABC", "bad": "x"}, rules)
+            invalid = create_validation_report({"code": "abc", "bad": "x"}, rules)
+
+            assert valid["valid"] is True
+            assert len(valid["warnings"]) == 1
+            assert invalid["valid"] is False
+            assert len(invalid["warnings"]) == 1
+
+    @pytest.mark.parametrize(
+        "pattern,value,valid",
+        [
+            pytest.param(r"^\d{3}", "123abc", True, id="unanchored-end-prefix"),
+            pytest.param(r"\d{3}$", "123", True, id="implicit-start-anchor"),
+            pytest.param(r"\d{3}$", "x123", False, id="no-search-semantics"),
+            pytest.param(r"^a|b$", "ax", True, id="top-level-alternation"),
+        ],
+    )
+    def test_pattern_match_semantics(
+        self, pattern: str, value: str, valid: bool
+    ) -> None:
+        """Test that patterns match from the start of the value, as re.match."""
+        result = create_validation_report(
+            {"field": value}, {"patterns": {"field": pattern}}
+        )
+
+        assert result["valid"] is valid
+
     def test_unexpected_fields_warning(self) -> None:
         """Test validation report with unexpected fields."""
         data = {"name": "Alice", "unexpected1": "value", "unexpected2": 123}
@@ -647,7 +816,20 @@ class TestCreateValidationReport:
         assert "unexpected1" in result["warnings"][0]
         assert "unexpected2" in result["warnings"][0]
 
-    def test_comprehensive_validation_report(self) -> None:
+    def test_unexpected_fields_in_data_order(self) -> None:
+        """Test that unexpected fields are listed in data order."""
+        data = {f"extra_{i}": i for i in range(20, 0, -1)}
+        data["name"] = "Alice"
+        rules = {"allowed_fields": ["name", "age"]}
+
+        result = create_validation_report(data, rules)
+
+        expected = [f"extra_{i}" for i in range(20, 0, -1)]
+        assert result["warnings"] == [f"Unexpected fields found: {expected}"]
+
+    def test_comprehensive_validation_report(
+        self, contact_rules: dict[str, Any]
+    ) -> None:
         """Test comprehensive validation with multiple rule types."""
         data = {
             "name": "Alice",
@@ -657,18 +839,8 @@ class TestCreateValidationReport:
             "phone": "123-456-7890",
             "extra": "unexpected",
         }
-        rules = {
-            "required": ["name", "age", "email"],
-            "types": {"name": "str", "age": "int", "email": "str", "score": "float"},
-            "ranges": {"age": {"min": 18, "max": 65}, "score": {"min": 0, "max": 100}},
-            "patterns": {
-                "email": r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
-                "phone": r"^\d{3}-\d{3}-\d{4}$",
-            },
-            "allowed_fields": ["name", "age", "email", "score", "phone"],
-        }
 
-        result = create_validation_report(data, rules)
+        result = create_validation_report(data, contact_rules)
 
         assert result["valid"] is True
         assert result["errors"] == []
@@ -693,15 +865,51 @@ class TestCreateValidationReport:
         """Test error handling for invalid data type."""
         rules = {"required": ["name"]}
 
-        with pytest.raises(TypeError, match="data must be a dictionary"):
+        with pytest.raises(TypeError) as exc_info:
             create_validation_report(["not", "dict"], rules)  # type: ignore[arg-type]
+        assert "data must be a dictionary" in str(exc_info.value)
 
     def test_invalid_rules_type(self) -> None:
         """Test error handling for invalid rules type."""
         data = {"name": "Alice"}
 
-        with pytest.raises(TypeError, match="rules must be a dictionary"):
+        with pytest.raises(TypeError) as exc_info:
             create_validation_report(data, ["not", "dict"])  # type: ignore[arg-type]
+        assert "rules must be a dictionary" in str(exc_info.value)
+
+    def test_read_only_mapping_rules_rejected(self) -> None:
+        """Test that rules must be a real dict, not a read-only mapping view."""
+        rules = MappingProxyType({"required": ["name"]})
+
+        with pytest.raises(TypeError) as exc_info:
+            create_validation_report({"name": "Alice"}, rules)  # type: ignore[arg-type]
+        assert "rules must be a dictionary" in str(exc_info.value)
+
+    def test_rules_mutation_after_report(self) -> None:
+        """Test that a reused rules dict is re-read after being modified."""
+        data = {"name": "Alice", "age": 70}
+        rules = {"required": ["name"], "ranges": {"age": {"min": 18, "max": 80}}}
+        assert create_validation_report(data, rules)["valid"] is True
+
+        rules["required"].append("email")
+        rules["ranges"]["age"]["max"] = 65
+        result = create_validation_report(data, rules)
+
+        assert result["valid"] is False
+        assert "Required fields are missing: ['email']" in result["errors"]
+        assert "Range validation failed for 'age'" in result["errors"][1]
+
+    def test_invalid_rule_types(self) -> None:
+        """Test error handling for malformed required and types rules."""
+        data = {"name": "Alice"}
+
+        with pytest.raises(TypeError) as exc_info:
+            create_validation_report(data, {"required": ("name",)})
+        assert "required must be a list" in str(exc_info.value)
+
+        with pytest.raises(TypeError) as exc_info:
+            create_validation_report(data, {"types": ["str"]})
+        assert "type_map must be a dictionary" in str(exc_info.value)
 
     def test_range_validation_missing_field(self) -> None:
         """Test range validation when field is missing from data."""
@@ -729,6 +937,105 @@ class TestCreateValidationReport:
         assert result["valid"] is True
         assert result["errors"] == []
 
+    def test_range_skipped_after_type_failure(self) -> None:
+        """Test that a field failing its type check gets no extra range error."""
+        data = {"age": "old", "score": 150}
+        rules = {
+            "types": {"age": "int", "score": "int"},
+            "ranges": {
+                "age": {"min": 0, "max": 120},
+                "score": {"min": 0, "max": 100},
+            },
+        }
+
+        result = create_validation_report(data, rules)
+
+        assert result["errors"] == [
+            "Type validation errors: Field 'age': expected int, got str",
+            "Range validation failed for 'score': Value 150 is above maximum 100",
+        ]
+
+    def test_none_values_are_checked(self) -> None:
+        """Test that fields present with a None value are still validated."""
+        data = {"score": None, "code": None}
+        rules = {
+            "ranges": {"score": {"min": 0, "max": 100}},
+            "patterns": {"code": r"^\d+$"},
+        }
+
+        result = create_validation_report(data, rules)
+
+        assert result["errors"] == [
+            "Range validation failed for 'score': value must be numeric",
+            "Field 'code' does not match pattern '^\\d+$'",
+        ]
+
+
+def _batch_records(count: int) -> list[dict[str, Any]]:
+    """Build records that cycle through valid and invalid contact data."""
+    variants: list[dict[str, Any]] = [
+        {"name": "Alice", "age": 30, "email": "alice@example.com", "score": 90.5},
+        {"name": "Bob", "age": 17, "email": "bob@example", "phone": "555-0100"},
+        {"name": 7, "email": "carol@example.com", "extra": True},
+        {},
+    ]
+    return [dict(variants[i % len(variants)], id=i) for i in range(count)]
+
+
+class TestValidateBatch:
+    """Test cases for validate_batch function."""
+
+    @pytest.mark.parametrize("count", [1, 100, 10_000])
+    def test_matches_per_record_reports(
+        self, count: int, contact_rules: dict[str, Any]
+    ) -> None:
+        """Test that batch reports match individual validation reports."""
+        rules = dict(
+            contact_rules, allowed_fields=[*contact_rules["allowed_fields"], "id"]
+        )
+        records = _batch_records(count)
+
+        reports = validate_batch(records, rules)
+
+        assert len(reports) == count
+        assert reports == [create_validation_report(r, rules) for r in records]
+
+    def test_empty_batch(self) -> None:
+        """Test that an empty batch returns no reports."""
+        assert validate_batch([], {"required": ["name"]}) == []
+
+    def test_reports_are_independent_json_dicts(self) -> None:
+        """Test that each report is its own JSON-serializable plain dict."""
+        reports = validate_batch([{}, {}], {"required": ["name"]})
+
+        for report in reports:
+            assert type(report) is dict
+            assert list(report) == [
+                "valid",
+                "errors",
+                "warnings",
+                "fields_validated",
+                "rules_applied",
+            ]
+            assert json.loads(json.dumps(report)) == report
+
+        reports[0]["errors"].append("changed")
+        assert reports[1]["errors"] == ["Required fields are missing: ['name']"]
+
+    def test_invalid_argument_types(self) -> None:
+        """Test error handling for invalid records and rules types."""
+        with pytest.raises(TypeError) as exc_info:
+            validate_batch({"name": "Alice"}, {})  # type: ignore[arg-type]
+        assert "records must be a list" in str(exc_info.value)
+
+        with pytest.raises(TypeError) as exc_info:
+            validate_batch([{"name": "Alice"}, "Bob"], {})  # type: ignore[list-item]
+        assert "records[1] must be a dictionary" in str(exc_info.value)
+
+        with pytest.raises(TypeError) as exc_info:
+            validate_batch([{"name": "Alice"}], ["not", "dict"])  # type: ignore[arg-type]
+        assert "rules must be a dictionary" in str(exc_info.value)
+
 
 class TestAliaseFunctions:
     """Test cases for alias functions."""
@@ -765,7 +1072,20 @@ class TestAliaseFunctions:
 class TestValidationIntegration:
     """Integration tests for validation functions working together."""
 
-    def test_complete_user_validation_workflow(self) -> None:
+    NAME_TYPE_RULES = {"types": {"name": "str"}}
+
+    @pytest.fixture(scope="class")
+    def partial_rules(self) -> dict[str, Any]:
+        """Rules where required passes but the type and range checks can fail."""
+        return {
+            "required": ["name"],
+            "types": {"name": "str", "age": "int"},
+            "ranges": {"score": {"min": 0, "max": 100}},
+        }
+
+    def test_complete_user_validation_workflow(
+        self, user_schema: dict[str, Any]
+    ) -> None:
         """Test complete user validation workflow."""
         # Valid user data
         user_data = {
@@ -788,23 +1108,14 @@ class TestValidationIntegration:
         assert validate_range_simple(user_data["score"], 0, 100) is True
 
         # Step 4: Schema validation
-        schema = {
-            "type": "object",
-            "properties": {
-                "name": {"type": "string"},
-                "age": {"type": "number"},
-                "email": {"type": "string"},
-            },
-            "required": ["name", "age", "email"],
-        }
-        assert validate_schema_simple(user_data, schema) is True
+        assert validate_schema_simple(user_data, user_schema) is True
 
         # Step 5: Comprehensive report
         rules = {
             "required": required_fields,
             "types": type_map,
             "ranges": {"age": {"min": 18, "max": 65}, "score": {"min": 0, "max": 100}},
-            "patterns": {"email": r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"},
+            "patterns": {"email": EMAIL_PATTERN},
         }
         report = create_validation_report(user_data, rules)
         assert report["valid"] is True
@@ -815,24 +1126,39 @@ class TestValidationIntegration:
 
         # Individual function should raise
         with pytest.raises(ValidationError):
-            validate_data_types_simple(invalid_data, {"name": "str"})
+            validate_data_types_simple(invalid_data, self.NAME_TYPE_RULES["types"])
 
         # Report should capture the error
-        rules = {"types": {"name": "str"}}
-        report = create_validation_report(invalid_data, rules)
+        report = create_validation_report(invalid_data, self.NAME_TYPE_RULES)
         assert report["valid"] is False
         assert len(report["errors"]) == 1
 
-    def test_partial_validation_success(self) -> None:
+    def test_partial_validation_success(self, partial_rules: dict[str, Any]) -> None:
         """Test partial validation where some rules pass and others fail."""
+        # name passes required and type checks; age and score fail
         data = {"name": "Alice", "age": "not_a_number", "score": 150}
-        rules = {
-            "required": ["name"],  # This should pass
-            "types": {"name": "str", "age": "int"},  # name passes, age fails
-            "ranges": {"score": {"min": 0, "max": 100}},  # This should fail
-        }
 
-        report = create_validation_report(data, rules)
+        report = create_validation_report(data, partial_rules)
         assert report["valid"] is False
         assert len(report["errors"]) == 2  # Type error + range error
         assert report["fields_validated"] == 3
+
+    def test_partial_rules_across_records(self, partial_rules: dict[str, Any]) -> None:
+        """Test that one rules object gives per-record results when reused."""
+        valid = {"name": "Bob", "age": 40, "score": 99}
+        invalid = {"name": "Carol", "age": 40, "score": -1}
+
+        assert create_validation_report(valid, partial_rules)["valid"] is True
+        assert create_validation_report(invalid, partial_rules)["errors"] == [
+            "Range validation failed for 'score': Value -1 is below minimum 0"
+        ]
+        assert create_validation_report(valid, partial_rules)["valid"] is True
+
+    def test_partial_rules_key_order(self, partial_rules: dict[str, Any]) -> None:
+        """Test that equal rules built in another key order give the same report."""
+        data = {"name": "Alice", "age": "not_a_number", "score": 150}
+        reordered = dict(reversed(list(partial_rules.items())))
+
+        assert create_validation_report(data, reordered) == create_validation_report(
+            data, partial_rules
+        )
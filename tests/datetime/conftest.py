@@ -0,0 +1,24 @@
+"""Pytest configuration for datetime tool tests."""
+
+from datetime import date
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def july_2025():
+    """Map each day of July 2025 to its ISO date string.
+
+    July 2025 starts on a Tuesday, so the 5th/6th are a weekend and the
+    7th-11th a full business week.
+    """
+    return {day: date(2025, 7, day).isoformat() for day in range(1, 32)}
+
+
+@pytest.fixture(scope="session")
+def reference_datetime():
+    """ISO datetime the time arithmetic tests shift from.
+
+    It falls on Tuesday 8 July 2025, the same day as july_2025[8].
+    """
+    return "2025-07-08T14:30:45"
@@ -11,35 +11,22 @@ from basic_open_agent_tools.datetime.business import (
 class TestGetNextBusinessDay:
     """Tests for get_next_business_day function."""
 
-    def test_friday_to_monday(self):
-        """Test next business day after Friday is Monday."""
-        result = get_next_business_day("2025-07-04")  # Friday
-        assert result == "2025-07-07"  # Monday
-
-    def test_saturday_to_monday(self):
-        """Test next business day after Saturday is Monday."""
-        result = get_next_business_day("2025-07-05")  # Saturday
-        assert result == "2025-07-07"  # Monday
-
-    def test_sunday_to_monday(self):
-        """Test next business day after Sunday is Monday."""
-        result = get_next_business_day("2025-07-06")  # Sunday
-        assert result == "2025-07-07"  # Monday
-
-    def test_monday_to_tuesday(self):
-        """Test next business day after Monday is Tuesday."""
-        result = get_next_business_day("2025-07-07")  # Monday
-        assert result == "2025-07-08"  # Tuesday
-
-    def test_thursday_to_friday(self):
-        """Test next business day after Thursday is Friday."""
-        result = get_next_business_day("2025-07-03")  # Thursday
-        assert result == "2025-07-04"  # Friday
-
-    def test_year_boundary(self):
-        """Test next business day across year boundary."""
-        result = get_next_business_day("2024-12-31")  # Tuesday
-        assert result == "2025-01-01"  # Wednesday
+    @pytest.mark.parametrize(
+        "date_string,expected",
+        [
+            pytest.param("2025-07-04", "2025-07-07", id="friday-to-monday"),
+            pytest.param("2025-07-05", "2025-07-07", id="saturday-to-monday"),
+            pytest.param("2025-07-06", "2025-07-07", id="sunday-to-monday"),
+            pytest.param("2025-07-07", "2025-07-08", id="monday-to-tuesday"),
+            pytest.param("2025-07-08", "2025-07-09", id="tuesday-to-wednesday"),
+            pytest.param("2025-07-09", "2025-07-10", id="wednesday-to-thursday"),
+            pytest.param("2025-07-03", "2025-07-04", id="thursday-to-friday"),
+            pytest.param("2024-12-31", "2025-01-01", id="year-boundary"),
+        ],
+    )
+    def test_next_business_day(self, date_string, expected):
+        """Test next business day for each kind of starting day."""
+        assert get_next_business_day(date_string) == expected
 
     def test_invalid_date(self):
         """Test with invalid date format."""
@@ -55,39 +42,35 @@ class TestGetNextBusinessDay:
 class TestIsBusinessDay:
     """Tests for is_business_day function."""
 
-    def test_monday_is_business_day(self):
-        """Test that Monday is a business day."""
-        assert is_business_day("2025-07-07") is True
-
-    def test_tuesday_is_business_day(self):
-        """Test that Tuesday is a business day."""
-        assert is_business_day("2025-07-08") is True
-
-    def test_wednesday_is_business_day(self):
-        """Test that Wednesday is a business day."""
-        assert is_business_day("2025-07-09") is True
-
-    def test_thursday_is_business_day(self):
-        """Test that Thursday is a business day."""
-        assert is_business_day("2025-07-10") is True
-
-    def test_friday_is_business_day(self):
-        """Test that Friday is a business day."""
-        assert is_business_day("2025-07-11") is True
-
-    def test_saturday_not_business_day(self):
-        """Test that Saturday is not a business day."""
-        assert is_business_day("2025-07-05") is False
-
-    def test_sunday_not_business_day(self):
-        """Test that Sunday is not a business day."""
-        assert is_business_day("2025-07-06") is False
+    @pytest.mark.parametrize(
+        "day,expected",
+        [
+            pytest.param(7, True, id="monday"),
+            pytest.param(8, True, id="tuesday"),
+            pytest.param(9, True, id="wednesday"),
+            pytest.param(10, True, id="thursday"),
+            pytest.param(11, True, id="friday"),
+            pytest.param(5, False, id="saturday"),
+            pytest.param(6, False, id="sunday"),
+        ],
+    )
+    def test_is_business_day(self, july_2025, day, expected):
+        """Test that only Monday through Friday are business days."""
+        assert is_business_day(july_2025[day]) is expected
 
     def test_invalid_date(self):
         """Test with invalid date format."""
         with pytest.raises(ValueError, match="Invalid ISO date format"):
             is_business_day("2025/07/07")
 
+    @pytest.mark.parametrize(
+        "date_string", ["20250707", "2025-W28-1", "２０２５-07-07"]
+    )
+    def test_non_extended_iso_forms_rejected(self, date_string):
+        """Test that only the YYYY-MM-DD form is accepted."""
+        with pytest.raises(ValueError, match="Invalid ISO date format"):
+            is_business_day(date_string)
+
     def test_non_string_input(self):
         """Test with non-string input."""
         with pytest.raises(TypeError, match="date_string must be a string"):
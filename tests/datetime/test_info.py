@@ -1,5 +1,7 @@
 """Tests for datetime information extraction functions."""
 
+import calendar
+
 import pytest
 
 from basic_open_agent_tools.datetime.info import (
@@ -15,26 +17,32 @@ from basic_open_agent_tools.datetime.info import (
 class TestGetWeekdayName:
     """Tests for get_weekday_name function."""
 
-    def test_monday(self):
-        """Test getting weekday name for Monday."""
-        result = get_weekday_name("2025-07-07")  # Monday
-        assert result == "Monday"
-
-    def test_friday(self):
-        """Test getting weekday name for Friday."""
-        result = get_weekday_name("2025-07-04")  # Friday
-        assert result == "Friday"
-
-    def test_sunday(self):
-        """Test getting weekday name for Sunday."""
-        result = get_weekday_name("2025-07-06")  # Sunday
-        assert result == "Sunday"
+    @pytest.mark.parametrize(
+        "day,expected",
+        [
+            pytest.param(7, "Monday", id="monday"),
+            pytest.param(4, "Friday", id="friday"),
+            pytest.param(6, "Sunday", id="sunday"),
+        ],
+    )
+    def test_weekday_name(self, july_2025, day, expected):
+        """Test getting the weekday name for a date."""
+        assert get_weekday_name(july_2025[day]) == expected
 
     def test_invalid_date(self):
         """Test with invalid date format."""
         with pytest.raises(ValueError, match="Invalid ISO date format"):
             get_weekday_name("invalid-date")
 
+    def test_repeated_dates_across_functions(self, july_2025):
+        """Test that reusing date strings gives consistent results and errors."""
+        for _ in range(3):
+            assert get_weekday_name(july_2025[8]) == "Tuesday"
+            assert get_month_name(july_2025[8]) == "July"
+            assert get_day_of_year(july_2025[8]) == 189
+            with pytest.raises(ValueError, match="Invalid ISO date format"):
+                get_weekday_name("2025-02-30")
+
     def test_non_string_input(self):
         """Test with non-string input."""
         with pytest.raises(TypeError, match="date_string must be a string"):
@@ -44,20 +52,35 @@ class TestGetWeekdayName:
 class TestGetMonthName:
     """Tests for get_month_name function."""
 
-    def test_january(self):
-        """Test getting month name for January."""
-        result = get_month_name("2025-01-15")
-        assert result == "January"
-
-    def test_july(self):
-        """Test getting month name for July."""
-        result = get_month_name("2025-07-08")
-        assert result == "July"
-
-    def test_december(self):
-        """Test getting month name for December."""
-        result = get_month_name("2025-12-31")
-        assert result == "December"
+    @pytest.mark.parametrize(
+        "date_string,expected",
+        [
+            pytest.param("2025-01-15", "January", id="january"),
+            pytest.param("2025-07-08", "July", id="july"),
+            pytest.param("2025-12-31", "December", id="december"),
+        ],
+    )
+    def test_month_name(self, date_string, expected):
+        """Test getting the month name for a date."""
+        assert get_month_name(date_string) == expected
+
+    def test_every_month(self):
+        """Test the English name of every month."""
+        names = [get_month_name(f"2025-{month:02d}-01") for month in range(1, 13)]
+        assert names == [
+            "January",
+            "February",
+            "March",
+            "April",
+            "May",
+            "June",
+            "July",
+            "August",
+            "September",
+            "October",
+            "November",
+            "December",
+        ]
 
     def test_invalid_date(self):
         """Test with invalid date format."""
@@ -136,21 +159,20 @@ class TestGetDayOfYear:
 class TestIsLeapYear:
     """Tests for is_leap_year function."""
 
-    def test_leap_year_2024(self):
-        """Test that 2024 is a leap year."""
-        assert is_leap_year(2024) is True
-
-    def test_non_leap_year_2025(self):
-        """Test that 2025 is not a leap year."""
-        assert is_leap_year(2025) is False
-
-    def test_century_non_leap_1900(self):
-        """Test that 1900 is not a leap year (century rule)."""
-        assert is_leap_year(1900) is False
-
-    def test_century_leap_2000(self):
-        """Test that 2000 is a leap year (400 year rule)."""
-        assert is_leap_year(2000) is True
+    @pytest.mark.parametrize(
+        "year,expected",
+        [
+            pytest.param(2024, True, id="leap-2024"),
+            pytest.param(2025, False, id="non-leap-2025"),
+            pytest.param(1900, False, id="century-non-leap-1900"),
+            pytest.param(2000, True, id="century-leap-2000"),
+            pytest.param(2100, False, id="century-non-leap-2100"),
+        ],
+    )
+    def test_leap_year(self, year, expected):
+        """Test leap years, including the century and 400 year rules."""
+        assert is_leap_year(year) is expected
+        assert is_leap_year(year) is calendar.isleap(year)
 
     def test_non_integer_input(self):
         """Test with non-integer input."""
@@ -161,40 +183,33 @@ class TestIsLeapYear:
 class TestGetDaysInMonth:
     """Tests for get_days_in_month function."""
 
-    def test_january_31_days(self):
-        """Test January has 31 days."""
-        result = get_days_in_month(2025, 1)
-        assert result == 31
-
-    def test_february_non_leap(self):
-        """Test February in non-leap year has 28 days."""
-        result = get_days_in_month(2025, 2)
-        assert result == 28
-
-    def test_february_leap(self):
-        """Test February in leap year has 29 days."""
-        result = get_days_in_month(2024, 2)
-        assert result == 29
-
-    def test_april_30_days(self):
-        """Test April has 30 days."""
-        result = get_days_in_month(2025, 4)
-        assert result == 30
-
-    def test_december_31_days(self):
-        """Test December has 31 days."""
-        result = get_days_in_month(2025, 12)
-        assert result == 31
-
-    def test_invalid_month_low(self):
-        """Test with month < 1."""
-        with pytest.raises(ValueError, match="month must be between 1 and 12"):
-            get_days_in_month(2025, 0)
-
-    def test_invalid_month_high(self):
-        """Test with month > 12."""
+    @pytest.mark.parametrize(
+        "year,month,expected",
+        [
+            pytest.param(2025, 1, 31, id="january"),
+            pytest.param(2025, 2, 28, id="february-non-leap"),
+            pytest.param(2024, 2, 29, id="february-leap"),
+            pytest.param(2025, 4, 30, id="april"),
+            pytest.param(2025, 12, 31, id="december"),
+        ],
+    )
+    def test_days_in_month(self, year, month, expected):
+        """Test the number of days in a month."""
+        assert get_days_in_month(year, month) == expected
+
+    @pytest.mark.parametrize("year", [1900, 2000, 2024, 2025])
+    @pytest.mark.parametrize("month", range(1, 13))
+    def test_days_in_month_matches_calendar(self, year, month):
+        """Test every month against calendar.monthrange."""
+        assert get_days_in_month(year, month) == calendar.monthrange(year, month)[1]
+
+    @pytest.mark.parametrize(
+        "month", [pytest.param(0, id="low"), pytest.param(13, id="high")]
+    )
+    def test_invalid_month(self, month):
+        """Test with month outside 1-12."""
         with pytest.raises(ValueError, match="month must be between 1 and 12"):
-            get_days_in_month(2025, 13)
+            get_days_in_month(2025, month)
 
     def test_non_integer_year(self):
         """Test with non-integer year."""
@@ -14,18 +14,29 @@ from src.basic_open_agent_tools.datetime.operations import (
     subtract_days,
 )
 
+# Microseconds are included so get_current_time can show them
+FROZEN_NOW = "2025-07-08 14:30:45.123456"
 
+TIMEZONES = ["UTC", "America/New_York", "Europe/London", "Asia/Tokyo"]
+
+
+@pytest.fixture(scope="class")
+def frozen_clock():
+    """Freeze the clock once for all tests in a class."""
+    with freeze_time(FROZEN_NOW) as frozen:
+        yield frozen
+
+
+@pytest.mark.usefixtures("frozen_clock")
 class TestGetCurrentDatetime:
     """Test get_current_datetime function."""
 
-    @freeze_time("2025-07-08 14:30:45")
     def test_get_current_datetime_utc(self):
         """Test getting current datetime in UTC."""
         result = get_current_datetime("UTC")
         assert result.startswith("2025-07-08T14:30:45")
         assert result.endswith("+00:00")
 
-    @freeze_time("2025-07-08 14:30:45")
     def test_get_current_datetime_timezone(self):
         """Test getting current datetime in different timezone."""
         result = get_current_datetime("America/New_York")
@@ -43,16 +54,15 @@ class TestGetCurrentDatetime:
             get_current_datetime(123)
 
 
+@pytest.mark.usefixtures("frozen_clock")
 class TestGetCurrentDate:
     """Test get_current_date function."""
 
-    @freeze_time("2025-07-08 14:30:45")
     def test_get_current_date_utc(self):
         """Test getting current date in UTC."""
         result = get_current_date("UTC")
         assert result == "2025-07-08"
 
-    @freeze_time("2025-07-08 14:30:45")
     def test_get_current_date_timezone(self):
         """Test getting current date in different timezone."""
         result = get_current_date("America/New_York")
@@ -69,17 +79,16 @@ class TestGetCurrentDate:
             get_current_date(123)
 
 
+@pytest.mark.usefixtures("frozen_clock")
 class TestGetCurrentTime:
     """Test get_current_time function."""
 
-    @freeze_time("2025-07-08 14:30:45.123456")
     def test_get_current_time_utc(self):
         """Test getting current time in UTC."""
         result = get_current_time("UTC")
         assert result.startswith("14:30:45")
         assert "123456" in result
 
-    @freeze_time("2025-07-08 14:30:45")
     def test_get_current_time_timezone(self):
         """Test getting current time in different timezone."""
         result = get_current_time("America/New_York")
@@ -100,33 +109,39 @@ class TestGetCurrentTime:
 class TestIsValidIsoDate:
     """Test is_valid_iso_date function."""
 
-    def test_valid_iso_dates(self):
-        """Test with valid ISO date strings."""
-        valid_dates = [
+    @pytest.mark.parametrize(
+        "date_str",
+        [
             "2025-07-08",
             "2000-01-01",
             "2024-12-31",
             "1999-02-28",
-            "2024-02-29",  # leap year
-        ]
-        for date_str in valid_dates:
-            assert is_valid_iso_date(date_str) is True
+            pytest.param("2024-02-29", id="leap-year"),
+        ],
+    )
+    def test_valid_iso_dates(self, date_str):
+        """Test with valid ISO date strings."""
+        assert is_valid_iso_date(date_str) is True
 
-    def test_invalid_iso_dates(self):
-        """Test with invalid ISO date strings."""
-        invalid_dates = [
+    @pytest.mark.parametrize(
+        "date_str",
+        [
             "invalid-date",
-            "2025-13-01",  # invalid month
-            "2025-12-32",  # invalid day
-            "2025-02-30",  # invalid day for February
-            "2023-02-29",  # not a leap year
-            "07-08-2025",  # wrong format
-            "2025/07/08",  # wrong separator
-            "",
-            "2025-7-8",  # missing leading zeros
-        ]
-        for date_str in invalid_dates:
-            assert is_valid_iso_date(date_str) is False
+            pytest.param("2025-13-01", id="invalid-month"),
+            pytest.param("2025-12-32", id="invalid-day"),
+            pytest.param("2025-02-30", id="invalid-february-day"),
+            pytest.param("2023-02-29", id="not-a-leap-year"),
+            pytest.param("07-08-2025", id="wrong-format"),
+            pytest.param("2025/07/08", id="wrong-separator"),
+            pytest.param("", id="empty"),
+            pytest.param("2025-7-8", id="missing-leading-zeros"),
+            pytest.param("20250708", id="compact-form"),
+            pytest.param("2025-W28-2", id="iso-week-form"),
+        ],
+    )
+    def test_invalid_iso_dates(self, date_str):
+        """Test with invalid ISO date strings."""
+        assert is_valid_iso_date(date_str) is False
 
     def test_non_string_input(self):
         """Test is_valid_iso_date with non-string input."""
@@ -137,34 +152,37 @@ class TestIsValidIsoDate:
 class TestIsValidIsoTime:
     """Test is_valid_iso_time function."""
 
-    def test_valid_iso_times(self):
-        """Test with valid ISO time strings."""
-        valid_times = [
+    @pytest.mark.parametrize(
+        "time_str",
+        [
             "14:30:45",
             "00:00:00",
             "23:59:59",
             "12:00:00.123456",
             "09:15:30.999999",
-        ]
-        for time_str in valid_times:
-            assert is_valid_iso_time(time_str) is True
+            # Python's fromisoformat() accepts these formats
+            pytest.param("12:30", id="hh-mm"),
+            pytest.param("12:30:45:123", id="colon-microseconds"),
+        ],
+    )
+    def test_valid_iso_times(self, time_str):
+        """Test with valid ISO time strings."""
+        assert is_valid_iso_time(time_str) is True
 
-    def test_invalid_iso_times(self):
-        """Test with invalid ISO time strings."""
-        invalid_times = [
+    @pytest.mark.parametrize(
+        "time_str",
+        [
             "invalid-time",
-            "25:00:00",  # invalid hour
-            "12:60:00",  # invalid minute
-            "12:30:60",  # invalid second
-            "",
-            "2:30:45",  # missing leading zero
-        ]
-        for time_str in invalid_times:
-            assert is_valid_iso_time(time_str) is False
-
-        # Python's fromisoformat() accepts these formats
-        assert is_valid_iso_time("12:30") is True  # HH:MM format
-        assert is_valid_iso_time("12:30:45:123") is True  # treats :123 as microseconds
+            pytest.param("25:00:00", id="invalid-hour"),
+            pytest.param("12:60:00", id="invalid-minute"),
+            pytest.param("12:30:60", id="invalid-second"),
+            pytest.param("", id="empty"),
+            pytest.param("2:30:45", id="missing-leading-zero"),
+        ],
+    )
+    def test_invalid_iso_times(self, time_str):
+        """Test with invalid ISO time strings."""
+        assert is_valid_iso_time(time_str) is False
 
     def test_non_string_input(self):
         """Test is_valid_iso_time with non-string input."""
@@ -175,37 +193,38 @@ class TestIsValidIsoTime:
 class TestIsValidIsoDatetime:
     """Test is_valid_iso_datetime function."""
 
-    def test_valid_iso_datetimes(self):
-        """Test with valid ISO datetime strings."""
-        valid_datetimes = [
+    @pytest.mark.parametrize(
+        "datetime_str",
+        [
             "2025-07-08T14:30:45",
             "2025-07-08T14:30:45.123456",
             "2025-07-08T00:00:00",
             "2025-12-31T23:59:59",
             "2025-07-08T14:30:45+00:00",
             "2025-07-08T14:30:45-05:00",
-        ]
-        for datetime_str in valid_datetimes:
-            assert is_valid_iso_datetime(datetime_str) is True
+            # Python's fromisoformat() accepts these formats
+            pytest.param("2025-07-08 14:30:45", id="space-separator"),
+            pytest.param("2025-07-08T14:30", id="missing-seconds"),
+            pytest.param("2025-07-08", id="date-only"),
+        ],
+    )
+    def test_valid_iso_datetimes(self, datetime_str):
+        """Test with valid ISO datetime strings."""
+        assert is_valid_iso_datetime(datetime_str) is True
 
-    def test_invalid_iso_datetimes(self):
-        """Test with invalid ISO datetime strings."""
-        invalid_datetimes = [
+    @pytest.mark.parametrize(
+        "datetime_str",
+        [
             "invalid-datetime",
-            "2025-07-08T25:30:45",  # invalid hour
-            "2025-13-08T14:30:45",  # invalid month
-            "",
-            "14:30:45",  # time only
-        ]
-        for datetime_str in invalid_datetimes:
-            assert is_valid_iso_datetime(datetime_str) is False
-
-        # Python's fromisoformat() accepts these formats
-        assert (
-            is_valid_iso_datetime("2025-07-08 14:30:45") is True
-        )  # space instead of T
-        assert is_valid_iso_datetime("2025-07-08T14:30") is True  # missing seconds
-        assert is_valid_iso_datetime("2025-07-08") is True  # date only (adds 00:00:00)
+            pytest.param("2025-07-08T25:30:45", id="invalid-hour"),
+            pytest.param("2025-13-08T14:30:45", id="invalid-month"),
+            pytest.param("", id="empty"),
+            pytest.param("14:30:45", id="time-only"),
+        ],
+    )
+    def test_invalid_iso_datetimes(self, datetime_str):
+        """Test with invalid ISO datetime strings."""
+        assert is_valid_iso_datetime(datetime_str) is False
 
     def test_non_string_input(self):
         """Test is_valid_iso_datetime with non-string input."""
@@ -335,17 +354,15 @@ class TestDateTimeOperationsIntegration:
 
         assert result_date == original_date
 
-    def test_multiple_timezone_consistency(self):
+    @pytest.mark.parametrize("tz", TIMEZONES)
+    def test_multiple_timezone_consistency(self, tz):
         """Test that date operations work consistently across timezones."""
         # All should return valid dates regardless of timezone
-        timezones = ["UTC", "America/New_York", "Europe/London", "Asia/Tokyo"]
-
-        for tz in timezones:
-            current_date = get_current_date(tz)
-            assert is_valid_iso_date(current_date) is True
+        current_date = get_current_date(tz)
+        assert is_valid_iso_date(current_date) is True
 
-            current_time = get_current_time(tz)
-            assert is_valid_iso_time(current_time) is True
+        current_time = get_current_time(tz)
+        assert is_valid_iso_time(current_time) is True
 
-            current_datetime = get_current_datetime(tz)
-            assert is_valid_iso_datetime(current_datetime) is True
+        current_datetime = get_current_datetime(tz)
+        assert is_valid_iso_datetime(current_datetime) is True
@@ -1,5 +1,7 @@
 """Tests for datetime ranges module."""
 
+from datetime import date, timedelta
+
 import pytest
 
 from src.basic_open_agent_tools.datetime.ranges import (
@@ -13,6 +15,7 @@ from src.basic_open_agent_tools.datetime.ranges import (
     get_quarter_dates,
     get_year_to_date_range,
     is_date_in_range,
+    is_dates_in_range,
 )
 
 
@@ -93,6 +96,15 @@ class TestGetQuarterDates:
         expected = {"start": "2024-01-01", "end": "2024-03-31"}
         assert result == expected
 
+    def test_get_quarter_dates_result_is_independent(self):
+        """Test that mutating a returned dict does not affect later calls."""
+        first = get_quarter_dates(2025, 1)
+        first["end"] = "changed"
+
+        second = get_quarter_dates(2025, 1)
+        assert second == {"start": "2025-01-01", "end": "2025-03-31"}
+        assert second is not first
+
     def test_get_quarter_dates_invalid_quarter(self):
         """Test get_quarter_dates with invalid quarter."""
         with pytest.raises(ValueError, match="quarter must be 1, 2, 3, or 4"):
@@ -203,6 +215,19 @@ class TestGetMonthsAgo:
         result = get_months_ago(1, "2024-03-29")
         assert result == "2024-02-29"  # Feb 29 exists in 2024
 
+    @pytest.mark.parametrize(
+        "months,reference_date,expected",
+        [
+            pytest.param(1, "2025-03-31", "2025-02-28", id="february-non-leap"),
+            pytest.param(1, "2024-03-31", "2024-02-29", id="february-leap"),
+            pytest.param(1, "2025-05-31", "2025-04-30", id="thirty-day-month"),
+            pytest.param(25, "2025-03-31", "2023-02-28", id="multiple-years"),
+        ],
+    )
+    def test_get_months_ago_clamps_to_month_end(self, months, reference_date, expected):
+        """Test that days past the end of the target month are clamped."""
+        assert get_months_ago(months, reference_date) == expected
+
     def test_get_months_ago_zero_months(self):
         """Test zero months ago."""
         result = get_months_ago(0, "2025-01-15")
@@ -222,25 +247,33 @@ class TestGetMonthsAgo:
 class TestGetLastBusinessDay:
     """Test get_last_business_day function."""
 
-    def test_get_last_business_day_monday(self):
+    def test_get_last_business_day_monday(self, july_2025):
         """Test last business day when reference is Monday."""
-        result = get_last_business_day("2025-07-07")  # Monday
-        assert result == "2025-07-07"
+        result = get_last_business_day(july_2025[7])  # Monday
+        assert result == july_2025[7]
 
-    def test_get_last_business_day_friday(self):
+    def test_get_last_business_day_friday(self, july_2025):
         """Test last business day when reference is Friday."""
-        result = get_last_business_day("2025-07-04")  # Friday
-        assert result == "2025-07-04"
+        result = get_last_business_day(july_2025[4])  # Friday
+        assert result == july_2025[4]
 
-    def test_get_last_business_day_saturday(self):
+    def test_get_last_business_day_saturday(self, july_2025):
         """Test last business day when reference is Saturday."""
-        result = get_last_business_day("2025-07-05")  # Saturday
-        assert result == "2025-07-04"  # Previous Friday
+        result = get_last_business_day(july_2025[5])  # Saturday
+        assert result == july_2025[4]  # Previous Friday
 
-    def test_get_last_business_day_sunday(self):
+    def test_get_last_business_day_sunday(self, july_2025):
         """Test last business day when reference is Sunday."""
-        result = get_last_business_day("2025-07-06")  # Sunday
-        assert result == "2025-07-04"  # Previous Friday
+        result = get_last_business_day(july_2025[6])  # Sunday
+        assert result == july_2025[4]  # Previous Friday
+
+    @pytest.mark.parametrize(
+        "day,expected_day",
+        [(7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 11), (13, 11)],
+    )
+    def test_get_last_business_day_full_week(self, july_2025, day, expected_day):
+        """Test every weekday from Monday 7 July to Sunday 13 July."""
+        assert get_last_business_day(july_2025[day]) == july_2025[expected_day]
 
     def test_get_last_business_day_invalid_date(self):
         """Test get_last_business_day with invalid date."""
@@ -286,12 +319,61 @@ class TestIsDateInRange:
         with pytest.raises(ValueError, match="Invalid ISO date format"):
             is_date_in_range("invalid", "2025-05-01", "2025-05-31")
 
+    @pytest.mark.parametrize(
+        "check_date,start_date,end_date",
+        [
+            pytest.param("2025-02-30", "2025-02-01", "2025-02-28", id="check"),
+            pytest.param("2025-02-15", "2025-02-00", "2025-02-28", id="start"),
+            pytest.param("2025-02-15", "2025-02-01", "2025-13-01", id="end"),
+        ],
+    )
+    def test_is_date_in_range_iso_shaped_invalid_date(
+        self, check_date, start_date, end_date
+    ):
+        """Test that dates shaped like YYYY-MM-DD but not on the calendar fail."""
+        with pytest.raises(ValueError, match="Invalid ISO date format"):
+            is_date_in_range(check_date, start_date, end_date)
+
     def test_is_date_in_range_non_string_input(self):
         """Test is_date_in_range with non-string input."""
         with pytest.raises(TypeError, match="check_date must be a string"):
             is_date_in_range(123, "2025-05-01", "2025-05-31")
 
 
+class TestIsDatesInRange:
+    """Test is_dates_in_range function."""
+
+    def test_is_dates_in_range_matches_single_checks(self):
+        """Test that each result matches is_date_in_range for the same date."""
+        dates = ["2025-04-30", "2025-05-01", "2025-05-15", "2025-05-31", "2025-06-01"]
+
+        result = is_dates_in_range(dates, "2025-05-01", "2025-05-31")
+
+        assert result == [False, True, True, True, False]
+        assert result == [
+            is_date_in_range(check, "2025-05-01", "2025-05-31") for check in dates
+        ]
+
+    def test_is_dates_in_range_empty_list(self):
+        """Test that an empty list gives an empty result."""
+        assert is_dates_in_range([], "2025-05-01", "2025-05-31") == []
+
+    def test_is_dates_in_range_invalid_date(self):
+        """Test is_dates_in_range with an invalid date in the list."""
+        with pytest.raises(ValueError, match="Invalid ISO date format"):
+            is_dates_in_range(["2025-05-15", "invalid"], "2025-05-01", "2025-05-31")
+
+    def test_is_dates_in_range_non_list_input(self):
+        """Test is_dates_in_range with a single string instead of a list."""
+        with pytest.raises(TypeError, match="check_dates must be a list"):
+            is_dates_in_range("2025-05-15", "2025-05-01", "2025-05-31")
+
+    def test_is_dates_in_range_non_string_item(self):
+        """Test is_dates_in_range with a non-string list item."""
+        with pytest.raises(TypeError, match=r"check_dates\[1\] must be a string"):
+            is_dates_in_range(["2025-05-15", 20250516], "2025-05-01", "2025-05-31")
+
+
 class TestGetMonthRange:
     """Test get_month_range function."""
 
@@ -325,6 +407,12 @@ class TestGetMonthRange:
         expected = {"start": "2025-12-01", "end": "2025-12-31"}
         assert result == expected
 
+    def test_get_month_range_last_supported_year(self):
+        """Test December of the last year date supports."""
+        result = get_month_range(9999, 12)
+        expected = {"start": "9999-12-01", "end": "9999-12-31"}
+        assert result == expected
+
     def test_get_month_range_invalid_month(self):
         """Test get_month_range with invalid month."""
         with pytest.raises(ValueError, match="month must be between 1 and 12"):
@@ -369,6 +457,19 @@ class TestCalculateDaysBetween:
         with pytest.raises(ValueError, match="Invalid ISO date format"):
             calculate_days_between("invalid", "2025-01-01")
 
+    @pytest.mark.parametrize("start_date", ["20250101", "2025-W01-3"])
+    def test_calculate_days_between_non_extended_iso_rejected(self, start_date):
+        """Test that only the YYYY-MM-DD form is accepted."""
+        with pytest.raises(ValueError, match="Invalid ISO date format"):
+            calculate_days_between(start_date, "2025-01-01")
+
+    def test_calculate_days_between_repeated_dates(self):
+        """Test that reusing date strings across range functions stays consistent."""
+        for _ in range(3):
+            assert calculate_days_between("2025-01-01", "2025-01-31") == 30
+            assert is_date_in_range("2025-01-15", "2025-01-01", "2025-01-31") is True
+            assert get_days_ago(30, "2025-01-31") == "2025-01-01"
+
     def test_calculate_days_between_non_string_input(self):
         """Test calculate_days_between with non-string input."""
         with pytest.raises(TypeError, match="start_date must be a string"):
@@ -410,6 +511,16 @@ class TestGetBusinessDaysInRange:
         )  # Mon-Fri, Mon-Fri
         assert result == 10
 
+    @pytest.mark.parametrize("start_day", range(6, 13))  # 2025-01-06 is a Monday
+    def test_get_business_days_in_range_matches_day_count(self, start_day):
+        """Test every start weekday and span length against a day-by-day count."""
+        start = date(2025, 1, start_day)
+        for length in range(1, 30):
+            days = [start + timedelta(days=offset) for offset in range(length)]
+            expected = sum(1 for day in days if day.weekday() < 5)
+            result = get_business_days_in_range(start.isoformat(), days[-1].isoformat())
+            assert result == expected
+
     def test_get_business_days_in_range_invalid_order(self):
         """Test get_business_days_in_range with start after end."""
         with pytest.raises(
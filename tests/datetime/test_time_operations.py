@@ -14,35 +14,29 @@ from basic_open_agent_tools.datetime.operations import (
 class TestAddHours:
     """Tests for add_hours function."""
 
-    def test_add_positive_hours(self):
-        """Test adding positive hours."""
-        result = add_hours("2025-07-08T14:30:45", 2)
-        assert result == "2025-07-08T16:30:45"
-
-    def test_add_negative_hours(self):
-        """Test adding negative hours (subtract)."""
-        result = add_hours("2025-07-08T14:30:45", -3)
-        assert result == "2025-07-08T11:30:45"
-
-    def test_add_hours_cross_day(self):
-        """Test adding hours that crosses day boundary."""
-        result = add_hours("2025-07-08T22:30:45", 4)
-        assert result == "2025-07-09T02:30:45"
-
-    def test_add_hours_cross_month(self):
-        """Test adding hours that crosses month boundary."""
-        result = add_hours("2025-06-30T22:00:00", 5)
-        assert result == "2025-07-01T03:00:00"
-
-    def test_add_hours_cross_year(self):
-        """Test adding hours that crosses year boundary."""
-        result = add_hours("2024-12-31T23:00:00", 2)
-        assert result == "2025-01-01T01:00:00"
-
-    def test_add_zero_hours(self):
-        """Test adding zero hours."""
-        result = add_hours("2025-07-08T14:30:45", 0)
-        assert result == "2025-07-08T14:30:45"
+    @pytest.mark.parametrize(
+        "hours,expected",
+        [
+            pytest.param(2, "2025-07-08T16:30:45", id="positive"),
+            pytest.param(-3, "2025-07-08T11:30:45", id="negative"),
+            pytest.param(0, "2025-07-08T14:30:45", id="zero"),
+        ],
+    )
+    def test_add_hours(self, reference_datetime, hours, expected):
+        """Test adding hours to the reference datetime."""
+        assert add_hours(reference_datetime, hours) == expected
+
+    @pytest.mark.parametrize(
+        "datetime_string,hours,expected",
+        [
+            pytest.param("2025-07-08T22:30:45", 4, "2025-07-09T02:30:45", id="day"),
+            pytest.param("2025-06-30T22:00:00", 5, "2025-07-01T03:00:00", id="month"),
+            pytest.param("2024-12-31T23:00:00", 2, "2025-01-01T01:00:00", id="year"),
+        ],
+    )
+    def test_add_hours_cross_boundary(self, datetime_string, hours, expected):
+        """Test adding hours that crosses a day, month or year boundary."""
+        assert add_hours(datetime_string, hours) == expected
 
     def test_invalid_datetime(self):
         """Test with invalid datetime format."""
@@ -54,39 +48,36 @@ class TestAddHours:
         with pytest.raises(TypeError, match="datetime_string must be a string"):
             add_hours(None, 2)
 
-    def test_non_integer_hours(self):
+    def test_non_integer_hours(self, reference_datetime):
         """Test with non-integer hours."""
         with pytest.raises(TypeError, match="hours must be an integer"):
-            add_hours("2025-07-08T14:30:45", "2")
+            add_hours(reference_datetime, "2")
 
 
 class TestSubtractHours:
     """Tests for subtract_hours function."""
 
-    def test_subtract_positive_hours(self):
+    def test_subtract_positive_hours(self, reference_datetime):
         """Test subtracting positive hours."""
-        result = subtract_hours("2025-07-08T14:30:45", 2)
+        result = subtract_hours(reference_datetime, 2)
         assert result == "2025-07-08T12:30:45"
 
-    def test_subtract_hours_cross_day(self):
-        """Test subtracting hours that crosses day boundary."""
-        result = subtract_hours("2025-07-08T02:30:45", 4)
-        assert result == "2025-07-07T22:30:45"
-
-    def test_subtract_hours_cross_month(self):
-        """Test subtracting hours that crosses month boundary."""
-        result = subtract_hours("2025-07-01T03:00:00", 5)
-        assert result == "2025-06-30T22:00:00"
-
-    def test_subtract_hours_cross_year(self):
-        """Test subtracting hours that crosses year boundary."""
-        result = subtract_hours("2025-01-01T01:00:00", 2)
-        assert result == "2024-12-31T23:00:00"
-
-    def test_subtract_negative_hours(self):
+    @pytest.mark.parametrize(
+        "datetime_string,hours,expected",
+        [
+            pytest.param("2025-07-08T02:30:45", 4, "2025-07-07T22:30:45", id="day"),
+            pytest.param("2025-07-01T03:00:00", 5, "2025-06-30T22:00:00", id="month"),
+            pytest.param("2025-01-01T01:00:00", 2, "2024-12-31T23:00:00", id="year"),
+        ],
+    )
+    def test_subtract_hours_cross_boundary(self, datetime_string, hours, expected):
+        """Test subtracting hours that crosses a day, month or year boundary."""
+        assert subtract_hours(datetime_string, hours) == expected
+
+    def test_subtract_negative_hours(self, reference_datetime):
         """Test subtracting negative hours raises error."""
         with pytest.raises(ValueError, match="hours must be positive"):
-            subtract_hours("2025-07-08T14:30:45", -2)
+            subtract_hours(reference_datetime, -2)
 
     def test_invalid_datetime(self):
         """Test with invalid datetime format."""
@@ -98,44 +89,38 @@ class TestSubtractHours:
         with pytest.raises(TypeError, match="datetime_string must be a string"):
             subtract_hours(20250708, 2)
 
-    def test_non_integer_hours(self):
+    def test_non_integer_hours(self, reference_datetime):
         """Test with non-integer hours."""
         with pytest.raises(TypeError, match="hours must be an integer"):
-            subtract_hours("2025-07-08T14:30:45", 2.5)
+            subtract_hours(reference_datetime, 2.5)
 
 
 class TestAddMinutes:
     """Tests for add_minutes function."""
 
-    def test_add_positive_minutes(self):
-        """Test adding positive minutes."""
-        result = add_minutes("2025-07-08T14:30:45", 30)
-        assert result == "2025-07-08T15:00:45"
-
-    def test_add_negative_minutes(self):
-        """Test adding negative minutes (subtract)."""
-        result = add_minutes("2025-07-08T14:30:45", -15)
-        assert result == "2025-07-08T14:15:45"
-
-    def test_add_minutes_cross_hour(self):
-        """Test adding minutes that crosses hour boundary."""
-        result = add_minutes("2025-07-08T14:45:30", 20)
-        assert result == "2025-07-08T15:05:30"
-
-    def test_add_minutes_cross_day(self):
-        """Test adding minutes that crosses day boundary."""
-        result = add_minutes("2025-07-08T23:45:00", 30)
-        assert result == "2025-07-09T00:15:00"
-
-    def test_add_zero_minutes(self):
-        """Test adding zero minutes."""
-        result = add_minutes("2025-07-08T14:30:45", 0)
-        assert result == "2025-07-08T14:30:45"
-
-    def test_add_large_minutes(self):
-        """Test adding large number of minutes."""
-        result = add_minutes("2025-07-08T14:30:45", 1440)  # 24 hours
-        assert result == "2025-07-09T14:30:45"
+    @pytest.mark.parametrize(
+        "minutes,expected",
+        [
+            pytest.param(30, "2025-07-08T15:00:45", id="positive"),
+            pytest.param(-15, "2025-07-08T14:15:45", id="negative"),
+            pytest.param(0, "2025-07-08T14:30:45", id="zero"),
+            pytest.param(1440, "2025-07-09T14:30:45", id="24-hours"),
+        ],
+    )
+    def test_add_minutes(self, reference_datetime, minutes, expected):
+        """Test adding minutes to the reference datetime."""
+        assert add_minutes(reference_datetime, minutes) == expected
+
+    @pytest.mark.parametrize(
+        "datetime_string,minutes,expected",
+        [
+            pytest.param("2025-07-08T14:45:30", 20, "2025-07-08T15:05:30", id="hour"),
+            pytest.param("2025-07-08T23:45:00", 30, "2025-07-09T00:15:00", id="day"),
+        ],
+    )
+    def test_add_minutes_cross_boundary(self, datetime_string, minutes, expected):
+        """Test adding minutes that crosses an hour or day boundary."""
+        assert add_minutes(datetime_string, minutes) == expected
 
     def test_invalid_datetime(self):
         """Test with invalid datetime format."""
@@ -147,54 +132,56 @@ class TestAddMinutes:
         with pytest.raises(TypeError, match="datetime_string must be a string"):
             add_minutes(None, 30)
 
-    def test_non_integer_minutes(self):
+    def test_non_integer_minutes(self, reference_datetime):
         """Test with non-integer minutes."""
         with pytest.raises(TypeError, match="minutes must be an integer"):
-            add_minutes("2025-07-08T14:30:45", "30")
+            add_minutes(reference_datetime, "30")
 
 
 class TestSubtractMinutes:
     """Tests for subtract_minutes function."""
 
-    def test_subtract_positive_minutes(self):
-        """Test subtracting positive minutes."""
-        result = subtract_minutes("2025-07-08T14:30:45", 15)
-        assert result == "2025-07-08T14:15:45"
-
-    def test_subtract_minutes_cross_hour(self):
-        """Test subtracting minutes that crosses hour boundary."""
-        result = subtract_minutes("2025-07-08T15:10:30", 20)
-        assert result == "2025-07-08T14:50:30"
-
-    def test_subtract_minutes_cross_day(self):
-        """Test subtracting minutes that crosses day boundary."""
-        result = subtract_minutes("2025-07-08T00:15:00", 30)
-        assert result == "2025-07-07T23:45:00"
-
-    def test_subtract_large_minutes(self):
-        """Test subtracting large number of minutes."""
-        result = subtract_minutes("2025-07-08T14:30:45", 1440)  # 24 hours
-        assert result == "2025-07-07T14:30:45"
-
-    def test_subtract_negative_minutes(self):
+    @pytest.mark.parametrize(
+        "minutes,expected",
+        [
+            pytest.param(15, "2025-07-08T14:15:45", id="positive"),
+            pytest.param(1440, "2025-07-07T14:30:45", id="24-hours"),
+        ],
+    )
+    def test_subtract_minutes(self, reference_datetime, minutes, expected):
+        """Test subtracting minutes from the reference datetime."""
+        assert subtract_minutes(reference_datetime, minutes) == expected
+
+    @pytest.mark.parametrize(
+        "datetime_string,minutes,expected",
+        [
+            pytest.param("2025-07-08T15:10:30", 20, "2025-07-08T14:50:30", id="hour"),
+            pytest.param("2025-07-08T00:15:00", 30, "2025-07-07T23:45:00", id="day"),
+        ],
+    )
+    def test_subtract_minutes_cross_boundary(self, datetime_string, minutes, expected):
+        """Test subtracting minutes that crosses an hour or day boundary."""
+        assert subtract_minutes(datetime_string, minutes) == expected
+
+    def test_subtract_negative_minutes(self, reference_datetime):
         """Test subtracting negative minutes raises error."""
         with pytest.raises(ValueError, match="minutes must be positive"):
-            subtract_minutes("2025-07-08T14:30:45", -15)
+            subtract_minutes(reference_datetime, -15)
 
     def test_invalid_datetime(self):
         """Test with invalid datetime format."""
         with pytest.raises(ValueError, match="Invalid ISO datetime format"):
             subtract_minutes("not-valid", 15)
 
-    def test_non_string_datetime(self):
+    def test_non_string_datetime(self, reference_datetime):
         """Test with non-string datetime."""
         with pytest.raises(TypeError, match="datetime_string must be a string"):
-            subtract_minutes(["2025-07-08T14:30:45"], 15)
+            subtract_minutes([reference_datetime], 15)
 
-    def test_non_integer_minutes(self):
+    def test_non_integer_minutes(self, reference_datetime):
         """Test with non-integer minutes."""
         with pytest.raises(TypeError, match="minutes must be an integer"):
-            subtract_minutes("2025-07-08T14:30:45", None)
+            subtract_minutes(reference_datetime, None)
 
 
 class TestCalculateTimeDifference:
@@ -232,6 +219,18 @@ class TestCalculateTimeDifference:
         )
         assert result == 30
 
+    def test_negative_with_microseconds(self):
+        """Test that partial seconds are truncated toward zero when negative."""
+        result = calculate_time_difference(
+            "14:30:30.500000", "14:30:00.000000", "seconds"
+        )
+        assert result == -30
+
+    def test_with_utc_offsets(self):
+        """Test that UTC offsets are applied for timezone-aware times."""
+        result = calculate_time_difference("14:30:00+02:00", "14:30:00+00:00", "hours")
+        assert result == 2
+
     def test_invalid_unit(self):
         """Test with invalid unit."""
         with pytest.raises(
@@ -1,5 +1,8 @@
 """Tests for timezone operations."""
 
+import zoneinfo
+from datetime import datetime
+
 import pytest
 
 from basic_open_agent_tools.datetime.timezone import (
@@ -94,6 +97,30 @@ class TestGetTimezoneOffset:
         result = get_timezone_offset("Europe/Paris")
         assert result in ["+01:00", "+02:00"]  # CET or CEST
 
+    @pytest.mark.parametrize(
+        "timezone,expected",
+        [
+            pytest.param("Asia/Kolkata", ["+05:30"], id="half-hour"),
+            pytest.param("Asia/Kathmandu", ["+05:45"], id="quarter-hour"),
+            pytest.param("America/St_Johns", ["-03:30", "-02:30"], id="negative"),
+        ],
+    )
+    def test_partial_hour_offset(self, timezone, expected):
+        """Test timezones whose offset is not a whole number of hours."""
+        assert get_timezone_offset(timezone) in expected
+
+    @pytest.mark.parametrize(
+        "timezone",
+        ["UTC", "America/New_York", "Asia/Tokyo", "Pacific/Chatham", "Etc/GMT+12"],
+    )
+    def test_matches_strftime(self, timezone):
+        """Test the offset against strftime's %z for the same zone."""
+        tz = zoneinfo.ZoneInfo(timezone)
+        before = datetime.now(tz).strftime("%z")
+        result = get_timezone_offset(timezone)
+        after = datetime.now(tz).strftime("%z")
+        assert result.replace(":", "") in (before, after)
+
     def test_invalid_timezone(self):
         """Test with invalid timezone."""
         with pytest.raises(ValueError, match="Invalid timezone"):
@@ -180,6 +207,15 @@ class TestIsValidTimezone:
         """Test random string returns False."""
         assert is_valid_timezone("NotATimezone") is False
 
+    def test_repeated_lookups(self):
+        """Test that repeated checks of the same names give the same answer."""
+        for _ in range(3):
+            assert is_valid_timezone("Asia/Tokyo") is True
+            assert is_valid_timezone("Invalid/Timezone") is False
+            assert is_valid_timezone("/etc/localtime") is False
+            with pytest.raises(ValueError, match="No time zone found"):
+                get_timezone_offset("Invalid/Timezone")
+
     def test_non_string_input(self):
         """Test with non-string input."""
         with pytest.raises(TypeError, match="timezone_string must be a string"):
@@ -54,6 +54,11 @@ class TestValidateDateRange:
         with pytest.raises(ValueError, match="Invalid ISO date format"):
             validate_date_range("2025-06-15", "2025-01-01", "invalid")
 
+    def test_invalid_max_date_when_below_min(self):
+        """Test that an invalid max_date is reported for an early date."""
+        with pytest.raises(ValueError, match="Invalid ISO date format"):
+            validate_date_range("2024-06-15", "2025-01-01", "invalid")
+
     def test_non_string_date(self):
         """Test with non-string date_string."""
         with pytest.raises(TypeError, match="date_string must be a string"):
@@ -122,6 +127,13 @@ class TestValidateDatetimeRange:
                 "not-a-datetime", "2025-01-01T00:00:00", "2025-12-31T23:59:59"
             )
 
+    def test_invalid_max_datetime_when_below_min(self):
+        """Test that an invalid max_datetime is reported for an early datetime."""
+        with pytest.raises(ValueError, match="Invalid ISO datetime format"):
+            validate_datetime_range(
+                "2024-06-15T12:00:00", "2025-01-01T00:00:00", "invalid"
+            )
+
     def test_non_string_datetime(self):
         """Test with non-string datetime_string."""
         with pytest.raises(TypeError, match="datetime_string must be a string"):
@@ -156,6 +168,10 @@ class TestIsValidDateFormat:
         result = is_valid_date_format("08.07.2025", "%d.%m.%Y")
         assert result is True
 
+    def test_unpadded_iso_fields_valid(self):
+        """Test that %Y-%m-%d still accepts unpadded month and day like strptime."""
+        assert is_valid_date_format("2025-7-8", "%Y-%m-%d") is True
+
     def test_wrong_format(self):
         """Test date with wrong format returns False."""
         result = is_valid_date_format("07/08/2025", "%Y-%m-%d")
@@ -171,6 +187,48 @@ class TestIsValidDateFormat:
         result = is_valid_date_format("2025-07-08 14:30:45", "%Y-%m-%d %H:%M:%S")
         assert result is True
 
+    @pytest.mark.parametrize(
+        "date_string,format_string,expected",
+        [
+            pytest.param(
+                "2025-07-08T14:30:45", "%Y-%m-%dT%H:%M:%S", True, id="t-separator"
+            ),
+            pytest.param(
+                "2025-07-08 14:30:45", "%Y-%m-%dT%H:%M:%S", False, id="wrong-separator"
+            ),
+            pytest.param(
+                "2025-07-08T14:30:45", "%Y-%m-%d %H:%M:%S", False, id="wrong-space"
+            ),
+            pytest.param(
+                "2025-07-08T24:00:00", "%Y-%m-%dT%H:%M:%S", False, id="hour-24"
+            ),
+            pytest.param(
+                "2025-02-29 12:00:00", "%Y-%m-%d %H:%M:%S", False, id="not-leap"
+            ),
+            pytest.param("2025-7-8 9:05:00", "%Y-%m-%d %H:%M:%S", True, id="unpadded"),
+        ],
+    )
+    def test_iso_datetime_formats(self, date_string, format_string, expected):
+        """Test ISO-style datetime formats against the strptime rules."""
+        assert is_valid_date_format(date_string, format_string) is expected
+
+    @pytest.mark.parametrize(
+        "date_string,format_string,expected",
+        [
+            pytest.param("12/31/2025", "%m/%d/%Y", True, id="us"),
+            pytest.param("02/29/2025", "%m/%d/%Y", False, id="us-not-leap"),
+            pytest.param("31/12/2025", "%m/%d/%Y", False, id="us-day-first"),
+            pytest.param("7/8/2025", "%m/%d/%Y", True, id="us-unpadded"),
+            pytest.param("29.02.2024", "%d.%m.%Y", True, id="european-leap"),
+            pytest.param("08-07-2025", "%d.%m.%Y", False, id="wrong-separator"),
+            pytest.param("20250708", "%Y%m%d", True, id="compact"),
+            pytest.param("20251308", "%Y%m%d", False, id="compact-month-13"),
+        ],
+    )
+    def test_numeric_formats(self, date_string, format_string, expected):
+        """Test all-numeric formats against the strptime rules."""
+        assert is_valid_date_format(date_string, format_string) is expected
+
     def test_non_string_date(self):
         """Test with non-string date_string."""
         with pytest.raises(TypeError, match="date_string must be a string"):
@@ -130,8 +130,8 @@ class TestLoadAllDataTools:
     def test_load_data_tools_expected_count(self) -> None:
         """Test that expected number of tools are loaded."""
         tools = load_all_data_tools()
-        # Expected: 61 data processing functions (22 JSON + 18 CSV + 5 validation + 16 config)
-        assert len(tools) == 61
+        # Expected: 62 data processing functions (22 JSON + 18 CSV + 6 validation + 16 config)
+        assert len(tools) == 62
 
     def test_load_data_tools_function_names(self) -> None:
         """Test that expected function names are present."""
@@ -235,7 +235,7 @@ class TestLoadDataValidationTools:
     def test_load_validation_tools_expected_count(self) -> None:
         """Test that expected number of tools are loaded."""
         tools = load_data_validation_tools()
-        assert len(tools) == 5
+        assert len(tools) == 6
 
     def test_load_validation_tools_all_callable(self) -> None:
         """Test that all returned items are callable."""
@@ -254,6 +254,7 @@ class TestLoadDataValidationTools:
             "validate_data_types_simple",
             "validate_range_simple",
             "create_validation_report",
+            "validate_batch",
         ]
 
         assert set(tool_names) == set(expected_functions)
@@ -524,7 +525,7 @@ class TestListAllAvailableTools:
         tools = list_all_available_tools()
 
         data_tools = tools["data"]
-        assert len(data_tools) == 61
+        assert len(data_tools) == 62
 
     def test_list_tools_function_names(self) -> None:
         """Test that expected function names are present in categories."""
@@ -584,8 +585,8 @@ class TestHelpersIntegration:
             json_tools, csv_tools, validation_tools, config_tools
         )
 
-        # Verify subcategories merge correctly (3 + 7 + 5 + 8 = 23)
-        assert len(specific_data_tools) == 23
+        # Verify subcategories merge correctly (3 + 7 + 6 + 8 = 24)
+        assert len(specific_data_tools) == 24
 
         # Verify subcategories are a subset of all data tools
         all_data_tools = load_all_data_tools()
@@ -141,8 +141,9 @@ class TestStrandsAgentExample:
         try:
             response = agent("What file operations can you perform?")
             assert isinstance(response, str)
+            response_lower = response.lower()
             assert any(
-                op in response.lower() for op in ["read", "write", "create", "delete"]
+                op in response_lower for op in ["read", "write", "create", "delete"]
             )
         except Exception as e:
             pytest.skip(f"File operations test failed: {e}")
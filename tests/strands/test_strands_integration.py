@@ -260,9 +260,12 @@ class TestStrandsToolCompatibility:
 class TestStrandsAgentExecution:
     """Test actual agent execution with Strands (requires API keys)."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def strands_agent(self):
-        """Create a test Strands agent with basic-open-agent-tools."""
+        """Create a test Strands agent with basic-open-agent-tools.
+
+        Built once per class; tests clear its conversation history first.
+        """
         try:
             from strands import Agent
             from strands.models.anthropic import AnthropicModel
@@ -301,12 +304,13 @@ class TestStrandsAgentExecution:
     def test_agent_responds_without_tools(self, strands_agent):
         """Test that agent responds to simple queries without using tools."""
         try:
+            strands_agent.messages.clear()
             response = strands_agent("Hello! What tools do you have available?")
             assert isinstance(response, str)
             assert len(response) > 0
+            response_lower = response.lower()
             assert any(
-                keyword in response.lower()
-                for keyword in ["file", "tools", "available"]
+                keyword in response_lower for keyword in ["file", "tools", "available"]
             )
         except Exception as e:
             pytest.skip(f"Agent execution failed: {e}")
@@ -314,12 +318,14 @@ class TestStrandsAgentExecution:
     def test_agent_tool_awareness(self, strands_agent):
         """Test that agent is aware of the tools it has."""
         try:
+            strands_agent.messages.clear()
             response = strands_agent("List the file system tools you have access to.")
             assert isinstance(response, str)
             assert len(response) > 0
             # Should mention some file-related functionality
+            response_lower = response.lower()
             assert any(
-                keyword in response.lower()
+                keyword in response_lower
                 for keyword in ["read", "file", "directory", "write"]
             )
         except Exception as e: